@@ -59,6 +59,9 @@ POWERUP_TYPES = [
     'freeze'       # Freeze the other player briefly
 ]
 
+# Index of each power-up type in per-player power-up timer arrays
+POWERUP_INDEX = {powerup_type: i for i, powerup_type in enumerate(POWERUP_TYPES)}
+
 # Power-up colors
 POWERUP_COLORS = {
     'speed': ORANGE,
@@ -160,6 +163,34 @@ LAND_PARTICLE_COUNT = 12  # Number of particles when landing
 TAG_PARTICLE_COUNT = 20  # Number of particles when one player tags another
 PARTICLE_SIZE_RANGE = (2, 5)  # Min/max size for particles
 
+# Sound Settings
+# Smaller buffers mean lower latency between play() and hearing the sound,
+# at the cost of more CPU time and a higher risk of audio underruns
+AUDIO_FREQUENCY = 44100  # Output sample rate in Hz
+AUDIO_SAMPLE_SIZE = -16  # Signed 16-bit samples
+AUDIO_OUTPUT_CHANNELS = 2  # Stereo
+AUDIO_BUFFER = 512  # Samples per buffer (~12 ms at 44.1 kHz)
+AUDIO_FALLBACK_BUFFER = 1024  # Used if the device rejects the smaller buffer
+SOUND_CHANNELS = 48  # Mixer channels allocated up front (SDL_mixer defaults to 8)
+SOUND_CHANNEL_GROWTH = 8  # Extra channels added when all channels are busy
+PRIORITY_CHANNEL = 0  # Reserved channel for gameplay-critical sounds
+POWERUP_CHANNEL = 1  # Reserved channel for power-up sounds
+MUSIC_CHANNEL = 2  # Reserved channel for short music tracks played from memory
+HAZARD_CHANNEL = 3  # Reserved channel for damage and obstacle sounds
+RESERVED_CHANNELS = 4  # Channels below this are never handed out for other sounds
+SOUND_CHANNEL_ASSIGNMENTS = {  # Sounds that always play on a reserved channel
+    "tag": PRIORITY_CHANNEL,
+    "tagged": PRIORITY_CHANNEL,
+    "game_over": PRIORITY_CHANNEL,
+    "damage": HAZARD_CHANNEL
+}
+SOUND_CHANNEL_PREFIXES = {  # Sound name prefixes that play on a reserved channel
+    "powerup_": POWERUP_CHANNEL,
+    "obstacle_": HAZARD_CHANNEL
+}
+SHORT_MUSIC_TRACKS = {"victory"}  # Jingles decoded up front instead of streamed
+CYCLED_SOUNDS = {"footstep"}  # Variations played in turn instead of at random, so none repeats back to back
+
 # Obstacle Settings
 OBSTACLE_DAMAGE = 1  # Damage done by damaging obstacles
 OBSTACLE_BOUNCE_STRENGTH = 15  # Bounce height from bouncing obstacles
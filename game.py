@@ -18,7 +18,7 @@ from particles import ParticleSystem
 from camera import Camera
 from tutorial import Tutorial
 from obstacle import Obstacle
-from sounds import sound_manager
+from sounds import sound_manager, get_sound_manager
 
 class Game:
     def __init__(self):
@@ -30,6 +30,10 @@ class Game:
         self.screen = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT), display_flags)
         pygame.display.set_caption("Tag Game")
         
+        # Start the sound manager now so its sounds decode in the background
+        # while the menu is showing, rather than on the first play mid-game
+        get_sound_manager()
+        
         # Set up the clock
         self.clock = pygame.time.Clock()
         
@@ -754,7 +758,7 @@ class Game:
                     
                     # Play powerup sound
                     from sounds import sound_manager
-                    sound_manager.play(f"powerup_{powerup.type}" if sound_manager.sounds.get(f"powerup_{powerup.type}") else "powerup_collect")
+                    sound_manager.play(f"powerup_{powerup.type}" if sound_manager.get_sound(f"powerup_{powerup.type}") else "powerup_collect")
                     
                     # Remove the power-up
                     self.powerups.pop(i)
@@ -6,7 +6,17 @@ Defines the Player class with custom physics properties and controls.
 import pygame
 import math
 import random
+import numpy as np
 from constants import *
+from utils import get_font
+
+# Mouth and closed-eye sprites keyed by (kind, size), shared by all players
+_FACE_ATLAS = {}
+
+# Power-up timer slots checked every frame
+_SPEED_INDEX = POWERUP_INDEX['speed']
+_SHIELD_INDEX = POWERUP_INDEX['shield']
+_INVISIBLE_INDEX = POWERUP_INDEX['invisible']
 
 class Player:
     def __init__(self, game, position, controls, player_id, is_tagger=False, 
@@ -86,6 +96,15 @@ class Player:
         else:
             self.expression = expression
         
+        # Accessories never change after creation, so pre-render them once
+        # and only blit (and rescale) them while drawing
+        self._accessory_surf = None
+        self._accessory_offset = (0, 0)
+        self._accessory_scaled = {}  # Scaled sprites keyed by integer draw radius
+        self._id_label = None  # Rendered player ID, created on first draw
+        if self.accessory != 'none':
+            self._accessory_surf, self._accessory_offset = self._build_accessory_surface()
+        
         # Movement properties
         self.speed = DEFAULT_SPEED
         self.jump_force = DEFAULT_JUMP_FORCE
@@ -117,6 +136,11 @@ class Player:
         if game.players is not None:
             game.players.append(self)
         
+        # Cached list of the other players (see get_opponents)
+        self._opponents = []
+        self._opponents_roster = None
+        self._opponents_count = 0
+        
         # Blob character customization - different traits for each player
         self.blob_traits = {
             # Visual traits
@@ -174,7 +198,8 @@ class Player:
         
         # Initialize power-up states
         if not hasattr(self, 'active_powerups'):
-            self.active_powerups = {}
+            # Remaining seconds per power-up, indexed by POWERUP_INDEX (0 = inactive)
+            self.active_powerups = np.zeros(len(POWERUP_TYPES), dtype=np.float32)
             self.is_frozen = False
             self.has_shield = False
             self.is_invisible = False
@@ -509,7 +534,7 @@ class Player:
         target_speed = self.move_direction * self.speed
         
         # Apply power-up effects
-        if 'speed' in self.active_powerups:
+        if self.active_powerups[_SPEED_INDEX] > 0:
             target_speed *= POWERUP_EFFECTS['speed']
             
         # Smoothly interpolate towards target speed
@@ -556,20 +581,20 @@ class Player:
         
     def update_powerups(self, dt_seconds):
         """Update power-up timers and remove expired power-ups."""
-        # Make a copy of keys to avoid modifying during iteration
-        powerup_keys = list(self.active_powerups.keys())
-        
-        for powerup in powerup_keys:
-            self.active_powerups[powerup] -= dt_seconds
-            if self.active_powerups[powerup] <= 0:
-                # Power-up has expired
-                del self.active_powerups[powerup]
-                
-                # Reset power-up specific states
-                if powerup == 'shield':
-                    self.has_shield = False
-                elif powerup == 'invisible':
-                    self.is_invisible = False
+        was_active = self.active_powerups > 0
+        if not was_active.any():
+            return
+        
+        # Count down all timers at once, clamping expired ones to zero
+        self.active_powerups -= dt_seconds
+        np.maximum(self.active_powerups, 0, out=self.active_powerups)
+        
+        # Reset power-up specific states for power-ups that just expired
+        expired = was_active & (self.active_powerups <= 0)
+        if expired[_SHIELD_INDEX]:
+            self.has_shield = False
+        if expired[_INVISIBLE_INDEX]:
+            self.is_invisible = False
         
     def update_animation(self, dt):
         """Update blob animation state."""
@@ -749,6 +774,11 @@ class Player:
     
     def draw(self, screen, camera=None):
         """Draw the player as a blob character with unique traits."""
+        # Bind draw functions locally to skip repeated module attribute lookups
+        _circle = pygame.draw.circle
+        _polygon = pygame.draw.polygon
+        _blit = screen.blit
+        
         x, y = int(self.x), int(self.y)
         
         # Apply camera transformations if provided
@@ -793,24 +823,29 @@ class Player:
             blue = max(0, color[2] - int(color[2] * flash_intensity * 0.8))
             color = (red, green, blue)
             
-        # Draw shield if active
-        if self.has_shield:
+        # Integer sizes used by the circles below, computed once per frame
+        # with fixed-point multiplies (n / 256) against the integer radius
+        R = int(radius)
+        R35 = (R * 90) >> 8   # ~0.35 * radius (half of the 0.7 * radius highlight)
+        R30 = (R * 77) >> 8   # ~0.3 * radius
+        R25 = R >> 2          # 0.25 * radius
+        
+        # Draw shield if active (skipped when too small to be visible)
+        shield_radius = (R * 333) >> 8  # ~1.3 * radius
+        if self.has_shield and shield_radius >= 2:
             # Draw outer shield
-            shield_radius = radius * 1.3
-            pygame.draw.circle(screen, POWERUP_COLORS['shield'], (x, y), int(shield_radius), 3)
+            _circle(screen, POWERUP_COLORS['shield'], (x, y), shield_radius, 3)
             
         # Draw the player blob
-        pygame.draw.circle(screen, color, (x, y), int(radius))
+        _circle(screen, color, (x, y), R)
         
         # Add highlight to make it look more blob-like
-        highlight_radius = radius * 0.7
-        highlight_offset = radius * 0.3
         highlight_color = self.get_highlight_color()
-        pygame.draw.circle(
+        _circle(
             screen, 
             highlight_color, 
-            (int(x - highlight_offset), int(y - highlight_offset)), 
-            int(highlight_radius * 0.5)
+            (x - R30, y - R30), 
+            R35
         )
         
         # Get personalized eye traits
@@ -826,296 +861,368 @@ class Player:
         # Direction affects eye position
         eye_direction = 1 if self.move_direction >= 0 else -1
         
+        # Integer eye geometry shared by open and closed eyes
+        eye_r = int(eye_radius)
+        eye_dx = eye_distance * eye_direction
+        left_eye_x = int(x - eye_dx)
+        right_eye_x = int(x + eye_dx)
+        eye_y = int(y - eye_y_offset)
+        
         # Draw eyes only if not blinking
         if not self.blob_traits['is_blinking']:
             # Left eye
-            pygame.draw.circle(
-                screen, 
-                WHITE, 
-                (int(x - eye_distance * eye_direction), int(y - eye_y_offset)), 
-                int(eye_radius)
-            )
+            _circle(screen, WHITE, (left_eye_x, eye_y), eye_r)
             # Right eye
-            pygame.draw.circle(
-                screen, 
-                WHITE, 
-                (int(x + eye_distance * eye_direction), int(y - eye_y_offset)), 
-                int(eye_radius)
-            )
+            _circle(screen, WHITE, (right_eye_x, eye_y), eye_r)
             
             # Draw pupils (follow movement direction)
+            pupil_r = int(eye_radius * 0.5)
             pupil_offset = eye_radius * 0.5 * eye_direction
-            pygame.draw.circle(
+            _circle(
                 screen, 
                 BLACK, 
-                (int(x - eye_distance * eye_direction + pupil_offset), int(y - eye_y_offset)), 
-                int(eye_radius * 0.5)
+                (int(x - eye_dx + pupil_offset), eye_y), 
+                pupil_r
             )
-            pygame.draw.circle(
+            _circle(
                 screen, 
                 BLACK, 
-                (int(x + eye_distance * eye_direction + pupil_offset), int(y - eye_y_offset)), 
-                int(eye_radius * 0.5)
+                (int(x + eye_dx + pupil_offset), eye_y), 
+                pupil_r
             )
         else:
-            # Draw closed eyes (simple lines)
-            eye_y = int(y - eye_y_offset)
-            pygame.draw.line(
-                screen, 
-                BLACK,
-                (int(x - eye_distance * eye_direction - eye_radius * 0.7), eye_y),
-                (int(x - eye_distance * eye_direction + eye_radius * 0.7), eye_y),
-                2
-            )
-            pygame.draw.line(
-                screen, 
-                BLACK,
-                (int(x + eye_distance * eye_direction - eye_radius * 0.7), eye_y),
-                (int(x + eye_distance * eye_direction + eye_radius * 0.7), eye_y),
-                2
-            )
+            # Draw closed eyes (simple lines) from the cached face atlas
+            lid = self.get_face_sprite('closed_eye', int(eye_radius * 0.7))
+            lid_anchor = lid.get_width() // 2
+            _blit(lid, (left_eye_x - lid_anchor, eye_y - lid_anchor))
+            _blit(lid, (right_eye_x - lid_anchor, eye_y - lid_anchor))
         
         # Draw mouth based on expression and tagger status
-        mouth_y = y + radius * 0.25
-        if self.is_tagger:  # Tagger has a mischievous smile
+        mouth_y = y + R25
+        mouth_kind = 'tagger' if self.is_tagger else self.expression
+        mouth = self.get_face_sprite(mouth_kind, R)
+        mouth_anchor = mouth.get_width() // 2
+        _blit(mouth, (x - mouth_anchor, mouth_y - mouth_anchor))
+        
+        # The player ID label never changes, so render it only once
+        if self._id_label is None:
+            self._id_label = get_font(18).render(str(self.player_id), True, WHITE)
+        id_label_rect = self._id_label.get_rect(center=(x, y - R - 15))
+        
+        # Tagger gets a crown in place of the accessory - never draw both
+        if self.is_tagger:
+            # Draw player ID
+            _blit(self._id_label, id_label_rect)
+            
+            crown_height = radius * 0.5
+            crown_width = radius * 1.0
+            crown_base_y = y - radius - 8
+            
+            # Crown base points
+            crown_points = [
+                (x - crown_width/2, crown_base_y),
+                (x - crown_width/2, crown_base_y - crown_height/2),
+                (x - crown_width/4, crown_base_y - crown_height/3),
+                (x, crown_base_y - crown_height),
+                (x + crown_width/4, crown_base_y - crown_height/3),
+                (x + crown_width/2, crown_base_y - crown_height/2),
+                (x + crown_width/2, crown_base_y),
+            ]
+            _polygon(screen, YELLOW, crown_points)
+            
+            # Add crown jewel
+            _circle(screen, RED, 
+                             (x, int(crown_base_y - crown_height/1.5)), 
+                             int(crown_height/6))
+        else:
+            # Draw player accessory
+            if self._accessory_surf is not None:
+                accessory_sprite, (offset_x, offset_y) = self.get_accessory_sprite(radius)
+                _blit(accessory_sprite, (x + offset_x, y + offset_y))
+            
+            # Draw player ID
+            _blit(self._id_label, id_label_rect)
+    
+    def get_face_sprite(self, kind, size):
+        """
+        Get a cached sprite for a mouth or closed eye.
+        
+        Mouths and closed eyes only depend on their kind and integer size, so
+        they are rasterized once into _FACE_ATLAS and blitted afterwards.
+        
+        Args:
+            kind: 'closed_eye', 'tagger' or a runner expression
+            size: integer blob radius (mouths) or eyelid half-width (closed eyes)
+            
+        Returns:
+            pygame.Surface: square sprite whose center is the feature's anchor point
+        """
+        key = (kind, size)
+        sprite = _FACE_ATLAS.get(key)
+        if sprite is None:
+            anchor = size + 2
+            sprite = pygame.Surface((anchor * 2, anchor * 2), pygame.SRCALPHA)
+            self.draw_face_feature(sprite, kind, anchor, anchor, size)
+            _FACE_ATLAS[key] = sprite
+        return sprite
+        
+    def draw_face_feature(self, surface, kind, x, mouth_y, R):
+        """Draw a mouth (anchored at mouth_y) or closed eye (anchored at its center)."""
+        if kind == 'closed_eye':
+            pygame.draw.line(surface, BLACK, (x - R, mouth_y), (x + R, mouth_y), 2)
+            return
+        
+        R80 = (R * 205) >> 8  # ~0.8 * radius
+        R60 = (R * 154) >> 8  # ~0.6 * radius
+        R50 = R >> 1          # 0.5 * radius
+        R40 = (R * 102) >> 8  # ~0.4 * radius
+        R30 = (R * 77) >> 8   # ~0.3 * radius
+        R20 = (R * 51) >> 8   # ~0.2 * radius
+        R15 = (R * 38) >> 8   # ~0.15 * radius
+        R10 = (R * 26) >> 8   # ~0.1 * radius
+        
+        if kind == 'tagger':  # Tagger has a mischievous smile
             pygame.draw.arc(
-                screen,
+                surface,
                 BLACK,
-                (x - radius * 0.5, mouth_y - radius * 0.3, radius, radius * 0.6),
+                (x - R50, mouth_y - R30, R, R60),
                 math.pi * 0.1, math.pi * 0.9, 
                 2
             )
         else:  # Different expressions for runner
-            if self.expression == 'happy':
+            if kind == 'happy':
                 # Happy smile
                 pygame.draw.arc(
-                    screen,
+                    surface,
                     BLACK,
-                    (x - radius * 0.4, mouth_y - radius * 0.2, radius * 0.8, radius * 0.4),
+                    (x - R40, mouth_y - R20, R80, R40),
                     0, math.pi,
                     2
                 )
-            elif self.expression == 'curious':
+            elif kind == 'curious':
                 # Smaller 'o' mouth
                 pygame.draw.circle(
-                    screen,
+                    surface,
                     BLACK,
-                    (x, int(mouth_y + radius * 0.1)),
-                    int(radius * 0.15),
+                    (x, mouth_y + R10),
+                    R15,
                     2
                 )
-            elif self.expression == 'excited':
+            elif kind == 'excited':
                 # Excited open smile
                 pygame.draw.arc(
-                    screen,
+                    surface,
                     BLACK,
-                    (int(x - radius * 0.4), int(mouth_y - radius * 0.2), 
-                     int(radius * 0.8), int(radius * 0.4)),
+                    (x - R40, mouth_y - R20, R80, R40),
                     0, 3.14,
                     3
                 )
                 # Add a small line in the middle for open mouth effect
                 pygame.draw.line(
-                    screen,
+                    surface,
                     BLACK,
-                    (int(x), int(mouth_y)),
-                    (int(x), int(mouth_y + radius * 0.15)),
+                    (x, mouth_y),
+                    (x, mouth_y + R15),
                     2
                 )
             else:  # 'determined'
                 # Straight line
                 pygame.draw.line(
-                    screen,
+                    surface,
                     BLACK,
-                    (int(x - radius * 0.3), int(mouth_y + radius * 0.1)),
-                    (int(x + radius * 0.3), int(mouth_y + radius * 0.1)),
+                    (x - R30, mouth_y + R10),
+                    (x + R30, mouth_y + R10),
                     2
                 )
         
-        # Draw player accessories (only if not the tagger)
-        if not self.is_tagger and self.accessory != 'none':
-            if self.accessory == 'bow':
-                # Draw a cute bow on top
-                bow_y = y - radius - 6
-                bow_width = radius * 0.5
-                bow_height = radius * 0.3
-                bow_color = (255, 100, 150)  # Pink bow
-                
-                # Bow center
-                pygame.draw.circle(screen, bow_color, (x, int(bow_y)), int(bow_height * 0.4))
-                
-                # Left bow side
-                pygame.draw.ellipse(
-                    screen, 
-                    bow_color,
-                    (int(x - bow_width), int(bow_y - bow_height/2), 
-                     int(bow_width * 0.8), int(bow_height))
-                )
-                
-                # Right bow side
-                pygame.draw.ellipse(
-                    screen, 
-                    bow_color,
-                    (int(x + bow_width * 0.2), int(bow_y - bow_height/2), 
-                     int(bow_width * 0.8), int(bow_height))
-                )
-                
-            elif self.accessory == 'hat':
-                # Draw a small hat
-                hat_y = y - radius - 5
-                hat_width = radius * 0.8
-                hat_height = radius * 0.5
-                hat_color = (60, 60, 180)  # Blue hat
-                
-                # Hat base
-                pygame.draw.ellipse(
-                    screen,
-                    hat_color,
-                    (int(x - hat_width/2), int(hat_y), 
-                     int(hat_width), int(hat_height * 0.4))
-                )
-                
-                # Hat top
-                pygame.draw.rect(
-                    screen,
-                    hat_color,
-                    (int(x - hat_width/4), int(hat_y - hat_height * 0.8),
-                     int(hat_width/2), int(hat_height * 0.8))
-                )
-                
-            elif self.accessory == 'glasses':
-                # Draw glasses
-                glasses_y = y - radius * 0.1
-                glasses_width = radius * 0.4
-                glasses_color = (30, 30, 30)
-                
-                # Left lens
-                pygame.draw.circle(
-                    screen,
-                    glasses_color,
-                    (int(x - glasses_width), int(glasses_y)),
-                    int(radius * 0.25),
-                    2
-                )
-                
-                # Right lens
-                pygame.draw.circle(
-                    screen,
-                    glasses_color,
-                    (int(x + glasses_width), int(glasses_y)),
-                    int(radius * 0.25),
-                    2
-                )
-                
-                # Bridge
-                pygame.draw.line(
-                    screen,
-                    glasses_color,
-                    (int(x - glasses_width * 0.5), int(glasses_y)),
-                    (int(x + glasses_width * 0.5), int(glasses_y)),
-                    2
-                )
-                
-            elif self.accessory == 'bowtie':
-                # Draw bowtie
-                bowtie_y = y + radius * 0.7
-                bowtie_width = radius * 0.6
-                bowtie_height = radius * 0.3
-                bowtie_color = (200, 0, 0)
-                
-                # Left side
-                pygame.draw.polygon(
-                    screen,
-                    bowtie_color,
-                    [
-                        (x, bowtie_y),
-                        (int(x - bowtie_width), int(bowtie_y - bowtie_height/2)),
-                        (int(x - bowtie_width), int(bowtie_y + bowtie_height/2))
-                    ]
-                )
-                
-                # Right side
-                pygame.draw.polygon(
-                    screen,
-                    bowtie_color,
-                    [
-                        (x, bowtie_y),
-                        (int(x + bowtie_width), int(bowtie_y - bowtie_height/2)),
-                        (int(x + bowtie_width), int(bowtie_y + bowtie_height/2))
-                    ]
-                )
-                
-                # Center knot
-                pygame.draw.circle(screen, bowtie_color, (x, int(bowtie_y)), int(radius * 0.1))
-                
-            elif self.accessory == 'crown':
-                # Draw a royal crown
-                crown_y = y - radius - 10
-                crown_width = radius * 0.7
-                crown_height = radius * 0.4
-                crown_color = (220, 180, 20)  # Gold color
-                
-                # Crown base
-                pygame.draw.rect(
-                    screen,
-                    crown_color,
-                    (int(x - crown_width/2), int(crown_y + crown_height * 0.6),
-                     int(crown_width), int(crown_height * 0.4))
-                )
-                
-                # Crown spikes
-                spike_count = 5
-                for i in range(spike_count):
-                    spike_x = x - crown_width/2 + (crown_width * i / (spike_count - 1))
-                    spike_height = crown_height * (0.8 if i % 2 == 0 else 1.0)  # Alternating heights
-                    
-                    pygame.draw.polygon(
-                        screen,
-                        crown_color,
-                        [
-                            (int(spike_x), int(crown_y + crown_height * 0.6)),
-                            (int(spike_x - crown_width * 0.06), int(crown_y + crown_height - spike_height)),
-                            (int(spike_x + crown_width * 0.06), int(crown_y + crown_height - spike_height))
-                        ]
-                    )
-                
-                # Add jewel to center spike
-                pygame.draw.circle(
-                    screen,
-                    (200, 50, 50),  # Ruby red
-                    (int(x), int(crown_y + crown_height * 0.3)),
-                    int(crown_width * 0.06)
-                )
+    def _build_accessory_surface(self):
+        """
+        Pre-render the accessory at the canonical player radius.
         
-        # Draw player ID
-        font = pygame.font.Font(None, 18)
-        text = font.render(str(self.player_id), True, WHITE)
-        text_rect = text.get_rect(center=(x, y - int(radius) - 15))
-        screen.blit(text, text_rect)
+        Returns:
+            tuple: (surface, (offset_x, offset_y)) where the offset is the sprite's
+            top-left corner relative to the blob center, or (None, (0, 0)) if the
+            accessory draws nothing
+        """
+        # Canvas large enough for every accessory (they sit on or above the blob)
+        canvas = pygame.Surface((PLAYER_RADIUS * 4, PLAYER_RADIUS * 5), pygame.SRCALPHA)
+        center_x, center_y = PLAYER_RADIUS * 2, PLAYER_RADIUS * 3
+        self.draw_accessory(canvas, center_x, center_y, PLAYER_RADIUS)
+        
+        # Crop to the pixels actually drawn
+        bounds = canvas.get_bounding_rect()
+        if bounds.width == 0 or bounds.height == 0:
+            return None, (0, 0)
+        sprite = canvas.subsurface(bounds).copy()
+        return sprite, (bounds.x - center_x, bounds.y - center_y)
+        
+    def get_accessory_sprite(self, radius):
+        """
+        Get the pre-rendered accessory scaled for the given draw radius.
         
-        # If tagger, draw a crown
-        if self.is_tagger:
-            crown_height = radius * 0.5
-            crown_width = radius * 1.0
-            crown_base_y = y - radius - 8
+        Args:
+            radius: current blob radius in screen pixels
             
-            # Crown base points
-            crown_points = [
-                (x - crown_width/2, crown_base_y),
-                (x - crown_width/2, crown_base_y - crown_height/2),
-                (x - crown_width/4, crown_base_y - crown_height/3),
-                (x, crown_base_y - crown_height),
-                (x + crown_width/4, crown_base_y - crown_height/3),
-                (x + crown_width/2, crown_base_y - crown_height/2),
-                (x + crown_width/2, crown_base_y),
-            ]
-            pygame.draw.polygon(screen, YELLOW, crown_points)
+        Returns:
+            tuple: (surface, (offset_x, offset_y)) relative to the blob center
+        """
+        size = max(1, int(radius))
+        cached = self._accessory_scaled.get(size)
+        if cached is None:
+            scale = size / PLAYER_RADIUS
+            width, height = self._accessory_surf.get_size()
+            sprite = pygame.transform.smoothscale(
+                self._accessory_surf,
+                (max(1, int(width * scale)), max(1, int(height * scale)))
+            )
+            offset = (int(self._accessory_offset[0] * scale), int(self._accessory_offset[1] * scale))
+            cached = (sprite, offset)
+            self._accessory_scaled[size] = cached
+        return cached
+        
+    def draw_accessory(self, surface, x, y, radius):
+        """Draw the player's accessory centered on a blob at (x, y) with the given radius."""
+        if self.accessory == 'bow':
+            # Draw a cute bow on top
+            bow_y = y - radius - 6
+            bow_width = radius * 0.5
+            bow_height = radius * 0.3
+            bow_color = (255, 100, 150)  # Pink bow
             
-            # Add crown jewel
-            pygame.draw.circle(screen, RED, 
-                             (x, int(crown_base_y - crown_height/1.5)), 
-                             int(crown_height/6))
-    
+            # Bow center
+            pygame.draw.circle(surface, bow_color, (x, int(bow_y)), int(bow_height * 0.4))
+            
+            # Left bow side
+            pygame.draw.ellipse(
+                surface, 
+                bow_color,
+                (int(x - bow_width), int(bow_y - bow_height/2), 
+                 int(bow_width * 0.8), int(bow_height))
+            )
+            
+            # Right bow side
+            pygame.draw.ellipse(
+                surface, 
+                bow_color,
+                (int(x + bow_width * 0.2), int(bow_y - bow_height/2), 
+                 int(bow_width * 0.8), int(bow_height))
+            )
+            
+        elif self.accessory == 'hat':
+            # Draw a small hat
+            hat_y = y - radius - 5
+            hat_width = radius * 0.8
+            hat_height = radius * 0.5
+            hat_color = (60, 60, 180)  # Blue hat
+            
+            # Hat base
+            pygame.draw.ellipse(
+                surface,
+                hat_color,
+                (int(x - hat_width/2), int(hat_y), 
+                 int(hat_width), int(hat_height * 0.4))
+            )
+            
+            # Hat top
+            pygame.draw.rect(
+                surface,
+                hat_color,
+                (int(x - hat_width/4), int(hat_y - hat_height * 0.8),
+                 int(hat_width/2), int(hat_height * 0.8))
+            )
+            
+        elif self.accessory == 'glasses':
+            # Draw glasses
+            glasses_y = y - radius * 0.1
+            glasses_width = radius * 0.4
+            glasses_color = (30, 30, 30)
+            
+            # Left lens
+            pygame.draw.circle(
+                surface,
+                glasses_color,
+                (int(x - glasses_width), int(glasses_y)),
+                int(radius * 0.25),
+                2
+            )
+            
+            # Right lens
+            pygame.draw.circle(
+                surface,
+                glasses_color,
+                (int(x + glasses_width), int(glasses_y)),
+                int(radius * 0.25),
+                2
+            )
+            
+            # Bridge
+            pygame.draw.line(
+                surface,
+                glasses_color,
+                (int(x - glasses_width * 0.5), int(glasses_y)),
+                (int(x + glasses_width * 0.5), int(glasses_y)),
+                2
+            )
+            
+        elif self.accessory == 'bowtie':
+            # Draw bowtie
+            bowtie_y = y + radius * 0.7
+            bowtie_width = radius * 0.6
+            bowtie_height = radius * 0.3
+            bowtie_color = (200, 0, 0)
+            
+            # Both sides as one (2, 3, 2) vertex array, converted to ints in one pass
+            half_height = bowtie_height / 2
+            bowtie_points = np.array([
+                [(x, bowtie_y), (x - bowtie_width, bowtie_y - half_height), (x - bowtie_width, bowtie_y + half_height)],
+                [(x, bowtie_y), (x + bowtie_width, bowtie_y - half_height), (x + bowtie_width, bowtie_y + half_height)]
+            ]).astype(np.int32).tolist()
+            
+            # Left and right sides
+            for side_points in bowtie_points:
+                pygame.draw.polygon(surface, bowtie_color, side_points)
+            
+            # Center knot
+            pygame.draw.circle(surface, bowtie_color, (x, int(bowtie_y)), int(radius * 0.1))
+            
+        elif self.accessory == 'crown':
+            # Draw a royal crown
+            crown_y = y - radius - 10
+            crown_width = radius * 0.7
+            crown_height = radius * 0.4
+            crown_color = (220, 180, 20)  # Gold color
+            
+            # Crown base
+            pygame.draw.rect(
+                surface,
+                crown_color,
+                (int(x - crown_width/2), int(crown_y + crown_height * 0.6),
+                 int(crown_width), int(crown_height * 0.4))
+            )
+            
+            # Crown spikes, built as one (spike_count, 3, 2) vertex array
+            spike_count = 5
+            spike_index = np.arange(spike_count)
+            spike_x = x - crown_width/2 + crown_width * spike_index / (spike_count - 1)
+            spike_height = crown_height * np.where(spike_index % 2 == 0, 0.8, 1.0)  # Alternating heights
+            spike_top_y = crown_y + crown_height - spike_height
+            spike_points = np.stack((
+                np.stack((spike_x, np.full(spike_count, crown_y + crown_height * 0.6)), axis=-1),
+                np.stack((spike_x - crown_width * 0.06, spike_top_y), axis=-1),
+                np.stack((spike_x + crown_width * 0.06, spike_top_y), axis=-1)
+            ), axis=1).astype(np.int32).tolist()
+            
+            for points in spike_points:
+                pygame.draw.polygon(surface, crown_color, points)
+            
+            # Add jewel to center spike
+            pygame.draw.circle(
+                surface,
+                (200, 50, 50),  # Ruby red
+                (int(x), int(crown_y + crown_height * 0.3)),
+                int(crown_width * 0.06)
+            )
+
     def get_highlight_color(self):
         """Generate a lighter version of the player's color for the blob highlight."""
         r = min(255, self.color[0] + 70)
@@ -1152,8 +1259,8 @@ class Player:
         
     def apply_powerup(self, powerup_type):
         """Apply a power-up effect to this player."""
-        # Set the power-up in the active power-ups dictionary with its duration
-        self.active_powerups[powerup_type] = POWERUP_DURATION
+        # Set the power-up's timer to its full duration
+        self.active_powerups[POWERUP_INDEX[powerup_type]] = POWERUP_DURATION
         
         # Apply power-up specific effects
         if powerup_type == 'shield':
@@ -1167,12 +1274,19 @@ class Player:
         elif powerup_type == 'invisible':
             self.is_invisible = True
         elif powerup_type == 'freeze':
-            # Find the other player and freeze them
-            for player in self.game.players:
-                if player != self:
-                    player.is_frozen = True
-                    player.frozen_timer = POWERUP_EFFECTS['freeze']
-                    break
+            # Freeze the opponents
+            for player in self.get_opponents():
+                player.is_frozen = True
+                player.frozen_timer = POWERUP_EFFECTS['freeze']
+        
+    def get_opponents(self):
+        """Get the other players in the game, cached until the roster changes."""
+        players = self.game.players
+        if self._opponents_roster is not players or self._opponents_count != len(players):
+            self._opponents = [player for player in players if player is not self]
+            self._opponents_roster = players
+            self._opponents_count = len(players)
+        return self._opponents
         
     def get_position(self):
         """Get the current position of the player."""
@@ -5,9 +5,32 @@ Defines the Power-up class with custom behaviors and animations.
 import pygame
 import random
 import math
+import numpy as np
 from constants import *
 
+# Render data shared by every power-up of the same type (flyweight).
+# Instances only keep their own position and animation state; the surfaces
+# below are built lazily the first time a type is drawn.
+_POWERUP_TEMPLATES = {}
+
 class PowerUp:
+    # Types whose decoration only depends on self.rotation and can be cached
+    _ROTATING_TYPES = ('speed', 'shield', 'freeze')
+    
+    # Snowflake geometry for the freeze power-up: six arms, each with two branches
+    _SNOW_ANGLES = np.arange(6, dtype=np.float32) * (np.pi / 3)
+    _SNOW_BRANCH_OFFSETS = np.array([np.pi / 6, -np.pi / 6], dtype=np.float32)
+    
+    # Lightning bolt outline for the speed power-up, in units of the radius
+    _BOLT_SHAPE = np.array([
+        (-0.4, -0.5),
+        (0.0, -0.1),
+        (-0.2, 0.0),
+        (0.4, 0.5),
+        (0.0, 0.1),
+        (0.2, 0.0)
+    ])
+    
     def __init__(self, position, powerup_type):
         """
         Initialize a power-up with position and type.
@@ -26,6 +49,10 @@ class PowerUp:
         self.rotation = 0
         self.rotation_speed = random.uniform(0.5, 2.0)
         
+        # Frame-coherence cache for the rotating decoration
+        self._last_rot_bucket = None
+        self._last_rot_surface = None
+        
         # Despawn timer - power-ups disappear after a while if not collected
         self.lifetime = POWERUP_DESPAWN_TIME
         self.flashing = False  # Will start flashing when about to disappear
@@ -75,6 +102,11 @@ class PowerUp:
         
     def draw(self, screen, camera=None):
         """Draw the power-up on the screen."""
+        # Bind draw functions locally to skip repeated module attribute lookups
+        _circle = pygame.draw.circle
+        _polygon = pygame.draw.polygon
+        _blit = screen.blit
+        
         # Base position with bob effect
         x, y = int(self.x), int(self.y + self.bob_offset)
         
@@ -88,92 +120,42 @@ class PowerUp:
         # Skip drawing every few frames if the powerup is about to expire (flashing effect)
         if self.flashing and pygame.time.get_ticks() % 300 < 150:
             # Just draw an outline when flashing
-            pygame.draw.circle(screen, WHITE, (x, y), self.radius + 1, 2)
+            _circle(screen, WHITE, (x, y), self.radius + 1, 2)
             return
         
-        # Create a lighter color for the highlight/glow
-        highlight_color = self.get_highlight_color()
+        # Shared surfaces and colors for this power-up type
+        template = self.get_template()
         
-        # Calculate rotation values for rotating elements
-        sin_rot = math.sin(math.radians(self.rotation))
-        cos_rot = math.cos(math.radians(self.rotation))
+        # Create a lighter color for the highlight/glow
+        highlight_color = template['highlight_color']
         
         # Draw enhanced outer glow
         for i in range(2):
-            glow_radius = self.radius * (1.2 + i*0.15) * self.glow_intensity
-            glow_alpha = 100 - (i * 40)  # Decreasing alpha for outer rings
-            glow_surface = pygame.Surface((int(glow_radius*2), int(glow_radius*2)), pygame.SRCALPHA)
-            
-            # Create a gradient for the glow
-            pygame.draw.circle(
-                glow_surface, 
-                (*self.color, glow_alpha), 
-                (int(glow_radius), int(glow_radius)), 
-                int(glow_radius)
-            )
-            screen.blit(
+            glow_radius = int(self.radius * (1.2 + i*0.15) * self.glow_intensity)
+            glow_surface = self.get_glow_surface(template, i, glow_radius)
+            _blit(
                 glow_surface, 
-                (x - int(glow_radius), y - int(glow_radius)), 
-                special_flags=pygame.BLEND_ALPHA_SDL2
+                (x - glow_radius, y - glow_radius), 
+                special_flags=pygame.BLEND_PREMULTIPLIED
             )
         
         # Draw the base circle
-        pygame.draw.circle(screen, self.color, (x, y), self.radius)
+        _circle(screen, self.color, (x, y), self.radius)
         
         # Draw a highlight on top for 3D effect
         highlight_pos = (x - int(self.radius*0.3), y - int(self.radius*0.3))
-        small_highlight = pygame.Surface((int(self.radius*0.5), int(self.radius*0.5)), pygame.SRCALPHA)
-        pygame.draw.circle(small_highlight, (255, 255, 255, 120), 
-                          (int(self.radius*0.25), int(self.radius*0.25)), 
-                          int(self.radius*0.25))
-        screen.blit(small_highlight, highlight_pos)
+        _blit(template['small_highlight'], highlight_pos)
         
         # Draw different visual effects based on power-up type
-        if self.type == 'speed':
-            # Speed power-up: draw lightning bolt
-            bolt_points = [
-                (x - self.radius * 0.4, y - self.radius * 0.5),
-                (x, y - self.radius * 0.1),
-                (x - self.radius * 0.2, y),
-                (x + self.radius * 0.4, y + self.radius * 0.5),
-                (x, y + self.radius * 0.1),
-                (x + self.radius * 0.2, y)
-            ]
-            # Rotate the bolt points
-            rotated_points = []
-            for px, py in bolt_points:
-                # Translate to origin
-                tx, ty = px - x, py - y
-                # Rotate
-                rx = tx * cos_rot - ty * sin_rot
-                ry = tx * sin_rot + ty * cos_rot
-                # Translate back
-                rotated_points.append((rx + x, ry + y))
-            
-            pygame.draw.polygon(screen, highlight_color, rotated_points)
-            
-        elif self.type == 'shield':
-            # Shield power-up: draw circular shield with rotating arcs
-            pygame.draw.circle(screen, highlight_color, (x, y), int(self.radius * 0.7), 2)
-            
-            # Add rotating arcs around the shield
-            for i in range(3):
-                angle_offset = self.rotation * 0.5 + (i * 120)
-                start_angle = math.radians(angle_offset)
-                end_angle = math.radians(angle_offset + 60)
-                
-                # Calculate arc points (approximating with lines)
-                arc_radius = self.radius * 0.9
-                arc_points = []
-                num_points = 10
-                for j in range(num_points):
-                    angle = start_angle + (end_angle - start_angle) * j / (num_points - 1)
-                    arc_x = x + arc_radius * math.cos(angle)
-                    arc_y = y + arc_radius * math.sin(angle)
-                    arc_points.append((arc_x, arc_y))
-                
-                if len(arc_points) >= 2:
-                    pygame.draw.lines(screen, highlight_color, False, arc_points, 2)
+        if self.type in self._ROTATING_TYPES:
+            # Sub-degree rotation changes are invisible, so only re-render the
+            # decoration when the rotation moves into a new 3 degree bucket
+            rotation_bucket = int(self.rotation) // 3
+            if rotation_bucket != self._last_rot_bucket:
+                self._last_rot_surface = self.render_rotating_decoration(highlight_color)
+                self._last_rot_bucket = rotation_bucket
+            half_size = self._last_rot_surface.get_width() // 2
+            _blit(self._last_rot_surface, (x - half_size, y - half_size))
             
         elif self.type == 'super_jump':
             # Super jump power-up: draw upward arrow with trail
@@ -183,7 +165,7 @@ class PowerUp:
                 (x, y - self.radius * 0.5),
                 (x + self.radius * 0.4, y + self.radius * 0.3)
             ]
-            pygame.draw.polygon(screen, highlight_color, arrow_points)
+            _polygon(screen, highlight_color, arrow_points)
             
             # Add some trailing particles below the arrow
             for i in range(3):
@@ -191,7 +173,7 @@ class PowerUp:
                 particle_radius = self.radius * 0.15 * (3 - i) / 3
                 trail_x = x + math.sin(pygame.time.get_ticks() * 0.01 + i) * self.radius * 0.2
                 trail_y = y + self.radius * trail_y_offset
-                pygame.draw.circle(screen, highlight_color, (int(trail_x), int(trail_y)), int(particle_radius))
+                _circle(screen, highlight_color, (int(trail_x), int(trail_y)), int(particle_radius))
             
         elif self.type == 'invisible':
             # Invisibility power-up: draw enhanced ghost-like shape
@@ -205,42 +187,20 @@ class PowerUp:
                 (x + self.radius * 0.4, y + self.radius * 0.1 + ghost_y_offset),
                 (x + self.radius * 0.4, y - self.radius * 0.3 + ghost_y_offset)
             ]
-            pygame.draw.polygon(screen, highlight_color, ghost_points)
+            _polygon(screen, highlight_color, ghost_points)
             
             # Add eyes
             eye_size = self.radius * 0.1
-            pygame.draw.circle(screen, WHITE, 
+            _circle(screen, WHITE, 
                               (int(x - self.radius * 0.2), int(y - self.radius * 0.1 + ghost_y_offset)), 
                               int(eye_size))
-            pygame.draw.circle(screen, WHITE, 
+            _circle(screen, WHITE, 
                               (int(x + self.radius * 0.2), int(y - self.radius * 0.1 + ghost_y_offset)), 
                               int(eye_size))
-            
-        elif self.type == 'freeze':
-            # Freeze power-up: draw enhanced snowflake
-            for i in range(6):
-                angle = i * math.pi / 3 + math.radians(self.rotation * 0.5)
-                # Main lines
-                x1 = x + self.radius * 0.7 * math.cos(angle)
-                y1 = y + self.radius * 0.7 * math.sin(angle)
-                pygame.draw.line(screen, highlight_color, (int(x), int(y)), (int(x1), int(y1)), 2)
-                
-                # Add crystal branches to each line
-                branch_angle1 = angle + math.pi / 6
-                branch_angle2 = angle - math.pi / 6
-                branch_length = self.radius * 0.3
-                
-                branch_x1 = x1 - branch_length * math.cos(branch_angle1)
-                branch_y1 = y1 - branch_length * math.sin(branch_angle1)
-                branch_x2 = x1 - branch_length * math.cos(branch_angle2)
-                branch_y2 = y1 - branch_length * math.sin(branch_angle2)
-                
-                pygame.draw.line(screen, highlight_color, (int(x1), int(y1)), (int(branch_x1), int(branch_y1)), 1)
-                pygame.draw.line(screen, highlight_color, (int(x1), int(y1)), (int(branch_x2), int(branch_y2)), 1)
         
         # Draw pulsing outline
         pulse = (math.sin(pygame.time.get_ticks() * 0.006) * 0.2) + 0.8  # Value between 0.6 and 1.0
-        pygame.draw.circle(
+        _circle(
             screen, 
             highlight_color, 
             (x, y), 
@@ -248,6 +208,135 @@ class PowerUp:
             2
         )
         
+    def render_rotating_decoration(self, highlight_color):
+        """
+        Render the rotation-driven decoration (speed, shield, freeze) into a sprite.
+        
+        Args:
+            highlight_color: color to draw the decoration with
+            
+        Returns:
+            pygame.Surface: square sprite centered on the power-up
+        """
+        half_size = self.radius + 2
+        surface = pygame.Surface((half_size * 2, half_size * 2), pygame.SRCALPHA)
+        x, y = half_size, half_size
+        
+        # Calculate rotation values for rotating elements
+        sin_rot = math.sin(math.radians(self.rotation))
+        cos_rot = math.cos(math.radians(self.rotation))
+        
+        if self.type == 'speed':
+            # Speed power-up: draw lightning bolt
+            # Rotate all bolt points with a single matrix product
+            rotation_matrix = np.array([[cos_rot, sin_rot], [-sin_rot, cos_rot]])
+            bolt_points = (self._BOLT_SHAPE * self.radius) @ rotation_matrix + (x, y)
+            rotated_points = bolt_points.astype(np.int32).tolist()
+            
+            pygame.draw.polygon(surface, highlight_color, rotated_points)
+            
+        elif self.type == 'shield':
+            # Shield power-up: draw circular shield with rotating arcs
+            pygame.draw.circle(surface, highlight_color, (x, y), int(self.radius * 0.7), 2)
+            
+            # Add rotating arcs around the shield
+            for i in range(3):
+                angle_offset = self.rotation * 0.5 + (i * 120)
+                start_angle = math.radians(angle_offset)
+                end_angle = math.radians(angle_offset + 60)
+            
+                # Calculate arc points (approximating with lines)
+                arc_radius = self.radius * 0.9
+                arc_points = []
+                num_points = 10
+                for j in range(num_points):
+                    angle = start_angle + (end_angle - start_angle) * j / (num_points - 1)
+                    arc_x = x + arc_radius * math.cos(angle)
+                    arc_y = y + arc_radius * math.sin(angle)
+                    arc_points.append((arc_x, arc_y))
+            
+                if len(arc_points) >= 2:
+                    pygame.draw.lines(surface, highlight_color, False, arc_points, 2)
+            
+        elif self.type == 'freeze':
+            # Freeze power-up: draw enhanced snowflake
+            # Compute all 18 line endpoints at once instead of per-arm trig
+            angles = self._SNOW_ANGLES + math.radians(self.rotation * 0.5)
+            
+            # Main lines
+            tips_x = x + self.radius * 0.7 * np.cos(angles)
+            tips_y = y + self.radius * 0.7 * np.sin(angles)
+            
+            # Crystal branches at the end of each line
+            branch_angles = angles + self._SNOW_BRANCH_OFFSETS[:, np.newaxis]
+            branch_length = self.radius * 0.3
+            branch_x = tips_x - branch_length * np.cos(branch_angles)
+            branch_y = tips_y - branch_length * np.sin(branch_angles)
+            
+            tips = np.stack((tips_x, tips_y), axis=-1).astype(np.int32).tolist()
+            branches1, branches2 = np.stack((branch_x, branch_y), axis=-1).astype(np.int32).tolist()
+            
+            for tip, branch1, branch2 in zip(tips, branches1, branches2):
+                pygame.draw.line(surface, highlight_color, (x, y), tip, 2)
+                pygame.draw.line(surface, highlight_color, tip, branch1, 1)
+                pygame.draw.line(surface, highlight_color, tip, branch2, 1)
+        
+        return surface
+        
+    def get_template(self):
+        """
+        Get the render data shared by all power-ups of this type.
+        
+        Returns:
+            dict: highlight color, highlight surface and glow surface cache
+        """
+        template = _POWERUP_TEMPLATES.get(self.type)
+        if template is None:
+            # Small white highlight for the 3D effect
+            small_highlight = pygame.Surface((int(self.radius*0.5), int(self.radius*0.5)), pygame.SRCALPHA)
+            pygame.draw.circle(small_highlight, (255, 255, 255, 120), 
+                              (int(self.radius*0.25), int(self.radius*0.25)), 
+                              int(self.radius*0.25))
+            
+            template = {
+                'highlight_color': self.get_highlight_color(),
+                'small_highlight': small_highlight,
+                'glow': {}  # Glow ring surfaces keyed by (ring, radius)
+            }
+            _POWERUP_TEMPLATES[self.type] = template
+        return template
+        
+    def get_glow_surface(self, template, ring, glow_radius):
+        """
+        Get a cached glow ring surface for this power-up type.
+        
+        Args:
+            template: shared render data from get_template()
+            ring: glow ring index (0 = inner, 1 = outer)
+            glow_radius: integer radius of the ring
+            
+        Returns:
+            pygame.Surface: the glow ring, with premultiplied alpha
+        """
+        key = (ring, glow_radius)
+        glow_surface = template['glow'].get(key)
+        if glow_surface is None:
+            glow_alpha = 100 - (ring * 40)  # Decreasing alpha for outer rings
+            glow_surface = pygame.Surface((glow_radius*2, glow_radius*2), pygame.SRCALPHA)
+            
+            # Create a gradient for the glow
+            pygame.draw.circle(
+                glow_surface, 
+                (*self.color, glow_alpha), 
+                (glow_radius, glow_radius), 
+                glow_radius
+            )
+            
+            # Premultiply once so every blit can take the cheaper premultiplied path
+            glow_surface = glow_surface.premul_alpha()
+            template['glow'][key] = glow_surface
+        return glow_surface
+        
     def get_highlight_color(self):
         """Generate a lighter version of the power-up's color for highlights."""
         r = min(255, self.color[0] + 100)
@@ -6,30 +6,73 @@ Handles loading and playing sound effects for various game events.
 import pygame
 import os
 import random
+import threading
+from constants import (AUDIO_FREQUENCY, AUDIO_SAMPLE_SIZE, AUDIO_OUTPUT_CHANNELS, AUDIO_BUFFER,
+                       AUDIO_FALLBACK_BUFFER, SOUND_CHANNELS, SOUND_CHANNEL_GROWTH, MUSIC_CHANNEL,
+                       RESERVED_CHANNELS, SOUND_CHANNEL_ASSIGNMENTS, SOUND_CHANNEL_PREFIXES,
+                       SHORT_MUSIC_TRACKS, CYCLED_SOUNDS)
+
+# Ask for a small, low-latency mixer buffer. This only records settings, so
+# it also applies when pygame.init() opens the audio device before the sound
+# manager is first used.
+pygame.mixer.pre_init(AUDIO_FREQUENCY, AUDIO_SAMPLE_SIZE, AUDIO_OUTPUT_CHANNELS, AUDIO_BUFFER)
 
 class SoundManager:
     def __init__(self):
-        """Initialize the sound manager, loading all sounds and setting volumes."""
-        # Initialize sound mixer
-        pygame.mixer.init()
+        """Initialize the sound manager, indexing all sounds and setting volumes.
+        
+        Sound files are decoded on a background thread so startup isn't
+        blocked; sound effects played before that finishes are skipped.
+        """
+        # Initialize sound mixer with the small buffer requested above,
+        # falling back to a larger one if the device can't handle it
+        try:
+            pygame.mixer.init()
+        except pygame.error:
+            pygame.mixer.pre_init(AUDIO_FREQUENCY, AUDIO_SAMPLE_SIZE, AUDIO_OUTPUT_CHANNELS, AUDIO_FALLBACK_BUFFER)
+            pygame.mixer.init()
+        
+        # Allocate enough channels that overlapping effects aren't dropped,
+        # keeping reserved ones per category so gameplay sounds and short
+        # music are never evicted by cosmetic effects
+        pygame.mixer.set_num_channels(SOUND_CHANNELS)
+        pygame.mixer.set_reserved(RESERVED_CHANNELS)
         
         # Set default volumes
         self.sfx_volume = 0.7  # 70%
         self.music_volume = 0.5  # 50%
         
-        # Create sound dictionaries
-        self.sounds = {}
+        # Create sound dictionaries; loaded sound effects are filled in by the
+        # preload thread, split by whether the sound has random variations
+        self._sounds_single = {}  # Name -> Sound, or None if unavailable
+        self._sounds_variants = {}  # Name -> list of available Sounds
+        self._priority_channel = {}  # Name -> reserved channel index
         self.music = {}
+        self.short_music = {}  # Short tracks decoded into memory, played on MUSIC_CHANNEL
+        
+        # Decoded sounds keyed by absolute path, so sound names sharing a
+        # file share a single buffer
+        self._chunk_cache = {}
+        
+        # Random source for picking sound variations
+        self._rand = random.Random()
         
-        # Load sound effects
-        self._load_sounds()
+        # Next variation to play for each sound in CYCLED_SOUNDS
+        self._variant_cursor = dict.fromkeys(CYCLED_SOUNDS, 0)
+        
+        # Index sound effects and music
+        self._index_sounds()
         
         # Settings
         self.enabled = True
         self.music_enabled = True
         
-    def _load_sounds(self):
-        """Load all sound effects from the sounds directory."""
+        # Decode sounds in the background; set once every file is loaded
+        self._ready = threading.Event()
+        threading.Thread(target=self._preload_sounds, daemon=True).start()
+        
+    def _index_sounds(self):
+        """Index sound effect and music files without decoding them."""
         # Create assets/sounds directory if it doesn't exist
         sounds_dir = os.path.join("assets", "sounds")
         if not os.path.exists(sounds_dir):
@@ -75,28 +118,16 @@ class SoundManager:
             "wind": "wind.wav"
         }
         
-        # Load all sound effects
+        # Store sound effect paths; the files are decoded on first play
+        self._paths = {}
+        self._variant_paths = {}
         for sound_name, filenames in sound_files.items():
             if isinstance(filenames, list):
-                # For sound variations (like footsteps), load all and store in a list
-                self.sounds[sound_name] = []
-                for filename in filenames:
-                    path = os.path.join(sounds_dir, filename)
-                    # Only try to load if the file exists
-                    if os.path.exists(path):
-                        sound = pygame.mixer.Sound(path)
-                        sound.set_volume(self.sfx_volume)
-                        self.sounds[sound_name].append(sound)
+                # For sound variations (like footsteps), store all paths in a list
+                self._variant_paths[sound_name] = [os.path.join(sounds_dir, filename) for filename in filenames]
             else:
                 # Regular single sound
-                path = os.path.join(sounds_dir, filenames)
-                # Only try to load if the file exists
-                if os.path.exists(path):
-                    self.sounds[sound_name] = pygame.mixer.Sound(path)
-                    self.sounds[sound_name].set_volume(self.sfx_volume)
-                else:
-                    # Create a placeholder if sound doesn't exist yet
-                    self.sounds[sound_name] = None
+                self._paths[sound_name] = os.path.join(sounds_dir, filenames)
         
         # Load background music tracks
         music_dir = os.path.join("assets", "music")
@@ -124,6 +155,99 @@ class SoundManager:
                 else:
                     self.music[music_name] = None
     
+    def _preload_sounds(self):
+        """Decode every sound effect and short music track, then mark the manager ready."""
+        for sound_name in list(self._paths) + list(self._variant_paths):
+            self.get_sound(sound_name)
+            
+        # Decode short tracks so they start without streaming latency
+        for music_name in SHORT_MUSIC_TRACKS:
+            path = self.music.get(music_name)
+            if path is not None:
+                track = self._get_chunk(path)
+                if track is not None:
+                    self.short_music[music_name] = track
+                    
+        self._ready.set()
+    
+    def _get_chunk(self, path):
+        """
+        Get the decoded sound for a file, decoding it only once per path.
+        
+        Args:
+            path: path to the sound file
+            
+        Returns:
+            pygame.mixer.Sound or None if the file is missing or unreadable
+        """
+        path = os.path.abspath(path)
+        if path in self._chunk_cache:
+            return self._chunk_cache[path]
+            
+        chunk = None
+        # Only try to load if the file exists
+        if os.path.exists(path):
+            try:
+                chunk = pygame.mixer.Sound(path)
+            except pygame.error:
+                print(f"Error loading sound: {path}")
+                
+        self._chunk_cache[path] = chunk
+        return chunk
+    
+    def _find_reserved_channel(self, sound_name):
+        """
+        Find the reserved channel a sound should always play on.
+        
+        Args:
+            sound_name: The name of the sound
+            
+        Returns:
+            int or None: reserved channel index, or None for general channels
+        """
+        channel = SOUND_CHANNEL_ASSIGNMENTS.get(sound_name)
+        if channel is not None:
+            return channel
+            
+        for prefix, channel in SOUND_CHANNEL_PREFIXES.items():
+            if sound_name.startswith(prefix):
+                return channel
+                
+        return None
+    
+    def get_sound(self, sound_name):
+        """
+        Get a sound effect by name, loading it on first use.
+        
+        Args:
+            sound_name: The name of the sound to get
+            
+        Returns:
+            pygame.mixer.Sound, a list of variations, or None if unavailable
+        """
+        if sound_name in self._sounds_single:
+            return self._sounds_single[sound_name]
+        if sound_name in self._sounds_variants:
+            return self._sounds_variants[sound_name]
+            
+        channel = self._find_reserved_channel(sound_name)
+        if channel is not None:
+            self._priority_channel[sound_name] = channel
+            
+        paths = self._variant_paths.get(sound_name)
+        if paths is not None:
+            # Load every available variation
+            variants = [s for s in (self._get_chunk(p) for p in paths) if s is not None]
+            self._sounds_variants[sound_name] = variants
+            return variants
+            
+        path = self._paths.get(sound_name)
+        sound = self._get_chunk(path) if path is not None else None
+        
+        # Cache the result, including None, so missing files aren't checked again
+        self._sounds_single[sound_name] = sound
+        return sound
+    
     def play(self, sound_name, force=False):
         """
         Play a sound effect by name.
@@ -135,19 +259,45 @@ class SoundManager:
         if not self.enabled and not force:
             return
             
-        sound = self.sounds.get(sound_name)
-        if sound is None:
-            # Sound doesn't exist or hasn't been loaded
+        if not self._ready.is_set():
+            # Still loading - skip rather than block the game
             return
             
-        # Handle sound variations (list of sounds)
-        if isinstance(sound, list):
-            if len(sound) > 0:
+        if sound_name not in self._sounds_single and sound_name not in self._sounds_variants:
+            # Not a preloaded sound - look it up once and cache the result
+            self.get_sound(sound_name)
+            
+        sound = self._sounds_single.get(sound_name)
+        if sound is None:
+            variants = self._sounds_variants.get(sound_name)
+            if not variants:
+                # Sound doesn't exist or couldn't be loaded
+                return
+            cursor = self._variant_cursor.get(sound_name)
+            if cursor is not None:
+                # Play variations in turn
+                sound = variants[cursor % len(variants)]
+                self._variant_cursor[sound_name] = cursor + 1
+            else:
                 # Play a random variation
-                random.choice(sound).play()
+                sound = variants[self._rand.randrange(len(variants))]
+            
+        reserved = self._priority_channel.get(sound_name)
+        if reserved is not None:
+            # Categorized sounds replace whatever is on their reserved channel
+            channel = pygame.mixer.Channel(reserved)
         else:
-            # Play the single sound
-            sound.play()
+            channel = pygame.mixer.find_channel()
+            if channel is None:
+                # Every channel is busy - allocate more, or as a last resort
+                # take over the longest-playing general channel
+                pygame.mixer.set_num_channels(pygame.mixer.get_num_channels() + SOUND_CHANNEL_GROWTH)
+                channel = pygame.mixer.find_channel(True)
+        channel.play(sound)
+                
+        # Volume is applied per channel rather than per Sound, since a decoded
+        # sound may be shared by several sound names
+        channel.set_volume(self.sfx_volume)
     
     def play_music(self, music_name, loop=True, force=False):
         """
@@ -161,6 +311,15 @@ class SoundManager:
         if not self.music_enabled and not force:
             return
             
+        track = self.short_music.get(music_name)
+        if track is not None:
+            # Play the pre-decoded track on its own channel
+            pygame.mixer.music.stop()
+            channel = pygame.mixer.Channel(MUSIC_CHANNEL)
+            channel.play(track, loops=-1 if loop else 0)
+            channel.set_volume(self.music_volume)
+            return
+            
         path = self.music.get(music_name)
         if path is None:
             # Music doesn't exist or hasn't been loaded
@@ -176,6 +335,7 @@ class SoundManager:
                 
         # Stop any currently playing music
         pygame.mixer.music.stop()
+        pygame.mixer.Channel(MUSIC_CHANNEL).stop()
         
         # Load and play the new track
         try:
@@ -189,6 +349,7 @@ class SoundManager:
     def stop_music(self):
         """Stop any currently playing music."""
         pygame.mixer.music.stop()
+        pygame.mixer.Channel(MUSIC_CHANNEL).stop()
     
     def set_sfx_volume(self, volume):
         """
@@ -197,16 +358,8 @@ class SoundManager:
         Args:
             volume: Volume level from 0.0 to 1.0
         """
+        # Applied to each channel as sounds start playing
         self.sfx_volume = max(0.0, min(1.0, volume))
-        
-        # Update volumes for all loaded sounds
-        for sound_name, sound in self.sounds.items():
-            if sound is not None:
-                if isinstance(sound, list):
-                    for s in sound:
-                        s.set_volume(self.sfx_volume)
-                else:
-                    sound.set_volume(self.sfx_volume)
     
     def set_music_volume(self, volume):
         """
@@ -217,6 +370,7 @@ class SoundManager:
         """
         self.music_volume = max(0.0, min(1.0, volume))
         pygame.mixer.music.set_volume(self.music_volume)
+        pygame.mixer.Channel(MUSIC_CHANNEL).set_volume(self.music_volume)
     
     def toggle_sounds(self):
         """Toggle sound effects on/off."""
@@ -230,12 +384,30 @@ class SoundManager:
         if self.music_enabled:
             # Resume music at current volume
             pygame.mixer.music.set_volume(self.music_volume)
+            pygame.mixer.Channel(MUSIC_CHANNEL).set_volume(self.music_volume)
         else:
             # Mute music but don't stop it
             pygame.mixer.music.set_volume(0.0)
+            pygame.mixer.Channel(MUSIC_CHANNEL).set_volume(0.0)
             
         return self.music_enabled
 
 
-# Create a global sound manager instance for easy importing
-sound_manager = SoundManager()
\ No newline at end of file
+_instance = None
+
+def get_sound_manager():
+    """Get the global sound manager, creating it (and starting audio) on first use."""
+    global _instance
+    if _instance is None:
+        _instance = SoundManager()
+    return _instance
+
+
+class _LazySoundManager:
+    """Stand-in that forwards to the global sound manager, creating it on first access."""
+    def __getattr__(self, name):
+        return getattr(get_sound_manager(), name)
+
+
+# Global sound manager for easy importing; audio is only initialized when first used
+sound_manager = _LazySoundManager()
\ No newline at end of file
@@ -4,11 +4,29 @@ Provides step-by-step interactive instructions with animations.
 """
 
 import pygame
-import random
 import math
 import time
+import numpy as np
 from constants import *
-from utils import draw_text
+from utils import convert_surface, get_font
+
+# Bright colors for the step transition particles
+PARTICLE_COLORS = [
+    (255, 220, 100),  # Yellow
+    (100, 255, 100),  # Green
+    (100, 200, 255),  # Blue
+    (255, 150, 100),  # Orange
+    (200, 100, 255)   # Purple
+]
+PARTICLE_MAX_SIZE = 8  # Particle sizes range from 2 up to this value
+
+# How often the "closest platform above the player" highlight is searched again
+HIGHLIGHT_REFRESH_TIME = 0.25  # Seconds
+HIGHLIGHT_REFRESH_DISTANCE = 8  # Pixels of vertical player movement
+
+# Sine lookup table for the arrow bounce, one full period in 256 steps
+_SIN_LUT = np.sin(np.linspace(0, 2 * np.pi, 256, endpoint=False)).tolist()
+_SIN_LUT_SCALE = 256 / (2 * math.pi)
 
 class Tutorial:
     def __init__(self, game):
@@ -21,7 +39,6 @@ class Tutorial:
         self.game = game
         self.current_step = 0
         self.steps = []
-        self.particles = []
         self.timer = 0
         self.active = False
         self.target_reached = False
@@ -30,8 +47,57 @@ class Tutorial:
         self.messages = []
         self.arrow_bounce = 0
         
+        # Particles are stored as a struct of arrays; only the first
+        # particle_count entries of each array are live
+        self.particle_capacity = 256
+        self.particle_count = 0
+        self.particle_x = np.zeros(self.particle_capacity, dtype=np.float32)
+        self.particle_y = np.zeros(self.particle_capacity, dtype=np.float32)
+        self.particle_vx = np.zeros(self.particle_capacity, dtype=np.float32)
+        self.particle_vy = np.zeros(self.particle_capacity, dtype=np.float32)
+        self.particle_size = np.zeros(self.particle_capacity, dtype=np.float32)
+        self.particle_lifetime = np.zeros(self.particle_capacity, dtype=np.float32)
+        self.particle_max_lifetime = np.ones(self.particle_capacity, dtype=np.float32)
+        self.particle_color = np.zeros(self.particle_capacity, dtype=np.uint8)
+        
+        # Pre-rendered particle sprites indexed by [color][integer size]
+        self.particle_sprites = [
+            [self.create_particle_sprite(color, size) for size in range(PARTICLE_MAX_SIZE + 1)]
+            for color in PARTICLE_COLORS
+        ]
+        
+        # Semi-transparent dark overlay, reused every frame
+        self.overlay = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT), pygame.SRCALPHA)
+        self.overlay.fill((0, 0, 0, 120))
+        
+        # Bouncing arrow, pointing downward with its tip at the bottom center
+        self.arrow_size = 20
+        self.arrow_surface = pygame.Surface((self.arrow_size + 1, self.arrow_size + 1), pygame.SRCALPHA)
+        pygame.draw.polygon(self.arrow_surface, (255, 255, 100), [
+            (self.arrow_size // 2, self.arrow_size),
+            (0, 0),
+            (self.arrow_size, 0)
+        ])
+        
+        # Rendered panel text for each step, keyed by step index
+        self.text_cache = {}
+        
+        # Highlight rects found for the current step, keyed by target type
+        self.highlight_cache = {}
+        
+        # Completion check for each step action
+        self.target_checks = {
+            'move_p1': self.check_moved,
+            'jump_p1': self.check_jumped,
+            'use_special_platform': self.check_special_platform,
+            'use_passthrough': self.check_passthrough,
+            'tag_player': self.check_tagged,
+            'collect_powerup': self.check_powerup_collected
+        }
+        
         # Create tutorial sequence
         self.create_tutorial_steps()
+        self.apply_current_step()
     
     def create_tutorial_steps(self):
         """Create the sequence of tutorial steps."""
@@ -118,13 +184,25 @@ class Tutorial:
             }
         ]
     
+    def apply_current_step(self):
+        """Copy the current step's settings into attributes used every frame."""
+        step = self.steps[self.current_step]
+        self.step_action = step.get('action')
+        self.step_auto_advance = step['auto_advance']
+        self.step_highlight = step.get('highlight')
+        
+        # Arrow target and its distance above the target, or (None, 0)
+        self.arrow_target_type, self.arrow_offset = step.get('arrow') or (None, 0)
+    
     def start(self):
         """Start the tutorial from the beginning."""
         self.current_step = 0
+        self.apply_current_step()
         self.active = True
         self.target_reached = False
         self.timer = 0
-        self.particles = []
+        self.particle_count = 0
+        self.highlight_cache = {}
         
         # Spawn a powerup for the powerup collection step
         if not self.game.powerups:
@@ -134,8 +212,10 @@ class Tutorial:
         """Advance to the next step of the tutorial."""
         if self.current_step < len(self.steps) - 1:
             self.current_step += 1
+            self.apply_current_step()
             self.target_reached = False
             self.timer = 0
+            self.highlight_cache = {}
             
             # Create success particles for transition
             self.create_success_particles()
@@ -167,20 +247,17 @@ class Tutorial:
         self.timer += dt
         
         # Update arrow bounce animation
-        self.arrow_bounce = math.sin(self.timer * 5) * 5
+        self.arrow_bounce = _SIN_LUT[int(self.timer * 5 * _SIN_LUT_SCALE) & 255] * 5
         
         # Check for auto-advance conditions
-        current_step = self.steps[self.current_step]
-        
-        if current_step['auto_advance'] and self.target_reached:
+        if self.step_auto_advance and self.target_reached:
             # Auto-advance after a short delay
             if self.timer > 1.0:  # 1 second delay after completing action
                 self.next_step()
         
         # Check for specific actions that mark step completion
-        action = current_step.get('action')
-        if action and not self.target_reached:
-            self.check_target_reached(action)
+        if self.step_action and not self.target_reached:
+            self.check_target_reached(self.step_action)
         
         # Update particles
         self.update_particles(dt)
@@ -195,56 +272,41 @@ class Tutorial:
         Returns:
             bool: True if target reached, False otherwise
         """
-        # Basic movement check
-        if target_type == 'move_p1':
-            # Check if player has moved left or right
-            player = self.game.player1
-            if abs(player.x - player.starting_x) > 50:
-                self.target_reached = True
-                return True
-        
-        # Jump check
-        elif target_type == 'jump_p1':
-            # Check if player has jumped
-            player = self.game.player1
-            if player.y < player.starting_y - 50:
-                self.target_reached = True
-                return True
-        
-        # Special platform check
-        elif target_type == 'use_special_platform':
-            # Check if player is on a jump platform
-            player = self.game.player1
-            if hasattr(player, 'current_platform') and player.current_platform:
-                if player.current_platform.platform_type == 'jump':
-                    self.target_reached = True
-                    return True
-        
-        # Passthrough platform check
-        elif target_type == 'use_passthrough':
-            # Check if player is passing through a platform
-            player = self.game.player1
-            if player.passing_through:
-                self.target_reached = True
-                return True
-        
-        # Tag player check
-        elif target_type == 'tag_player':
-            # Check if a tag has occurred
-            if self.game.player1.is_tagger != self.game.player1.was_tagger_at_start:
-                self.target_reached = True
-                return True
-        
-        # Powerup collection check
-        elif target_type == 'collect_powerup':
-            # Check if a powerup has been collected
-            player = self.game.player1
-            if player.active_powerups:
-                self.target_reached = True
-                return True
+        check = self.target_checks.get(target_type)
+        if check and check():
+            self.target_reached = True
+            return True
         
         return False
     
+    def check_moved(self):
+        """Check if player 1 has moved left or right."""
+        player = self.game.player1
+        return abs(player.x - player.starting_x) > 50
+    
+    def check_jumped(self):
+        """Check if player 1 has jumped."""
+        player = self.game.player1
+        return player.y < player.starting_y - 50
+    
+    def check_special_platform(self):
+        """Check if player 1 is on a jump platform."""
+        platform = getattr(self.game.player1, 'current_platform', None)
+        return bool(platform) and platform.platform_type == 'jump'
+    
+    def check_passthrough(self):
+        """Check if player 1 is passing through a platform."""
+        return bool(self.game.player1.passing_through)
+    
+    def check_tagged(self):
+        """Check if a tag has occurred."""
+        player = self.game.player1
+        return player.is_tagger != player.was_tagger_at_start
+    
+    def check_powerup_collected(self):
+        """Check if a powerup has been collected."""
+        return bool(self.game.player1.active_powerups.any())
+    
     def handle_event(self, event):
         """
         Handle pygame events for tutorial interaction.
@@ -261,69 +323,143 @@ class Tutorial:
         if event.type == pygame.KEYDOWN:
             if event.key == pygame.K_SPACE:
                 # If step doesn't require specific action, advance on space
-                current_step = self.steps[self.current_step]
-                if not current_step['action'] or self.target_reached:
+                if not self.step_action or self.target_reached:
                     self.next_step()
                     return True
         
         return False
     
+    def create_particle_sprite(self, color, size):
+        """
+        Render a single particle circle.
+        
+        Args:
+            color: RGB color tuple
+            size: integer particle radius
+            
+        Returns:
+            pygame.Surface: particle sprite with per-pixel alpha
+        """
+        size = max(1, size)
+        sprite = pygame.Surface((size * 2, size * 2), pygame.SRCALPHA)
+        pygame.draw.circle(sprite, color, (size, size), size)
+        return sprite
+    
+    def get_particle_arrays(self):
+        """Get all per-particle arrays, in a fixed order."""
+        return (
+            self.particle_x, self.particle_y,
+            self.particle_vx, self.particle_vy,
+            self.particle_size,
+            self.particle_lifetime, self.particle_max_lifetime,
+            self.particle_color
+        )
+    
+    def reserve_particles(self, count):
+        """
+        Make sure there is room for count more particles, growing the arrays if needed.
+        
+        Args:
+            count: number of particles about to be added
+        """
+        needed = self.particle_count + count
+        if needed <= self.particle_capacity:
+            return
+            
+        capacity = self.particle_capacity
+        while capacity < needed:
+            capacity *= 2
+            
+        (self.particle_x, self.particle_y,
+         self.particle_vx, self.particle_vy,
+         self.particle_size,
+         self.particle_lifetime, self.particle_max_lifetime,
+         self.particle_color) = [np.resize(array, capacity) for array in self.get_particle_arrays()]
+        self.particle_capacity = capacity
+    
     def create_success_particles(self):
         """Create particles for successful action completion."""
         # Generate particles around the center of the screen
         center_x, center_y = SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2
         num_particles = 40
         
-        for _ in range(num_particles):
-            # Random position around center
-            angle = random.uniform(0, math.pi * 2)
-            distance = random.uniform(50, 150)
-            x = center_x + math.cos(angle) * distance
-            y = center_y + math.sin(angle) * distance
-            
-            # Random particle properties
-            size = random.uniform(2, 8)
-            lifetime = random.uniform(0.5, 1.5)
-            speed = random.uniform(50, 150)
-            
-            # Random color (bright colors)
-            colors = [
-                (255, 220, 100),  # Yellow
-                (100, 255, 100),  # Green
-                (100, 200, 255),  # Blue
-                (255, 150, 100),  # Orange
-                (200, 100, 255)   # Purple
-            ]
-            color = random.choice(colors)
-            
-            # Add particle
-            self.particles.append({
-                'x': x,
-                'y': y,
-                'vx': math.cos(angle) * speed,
-                'vy': math.sin(angle) * speed,
-                'size': size,
-                'lifetime': lifetime,
-                'max_lifetime': lifetime,
-                'color': color
-            })
+        self.reserve_particles(num_particles)
+        start = self.particle_count
+        end = start + num_particles
+        
+        # Random position around center
+        angles = np.random.uniform(0, math.pi * 2, num_particles)
+        distances = np.random.uniform(50, 150, num_particles)
+        cos_angles = np.cos(angles)
+        sin_angles = np.sin(angles)
+        self.particle_x[start:end] = center_x + cos_angles * distances
+        self.particle_y[start:end] = center_y + sin_angles * distances
+        
+        # Random particle properties
+        speeds = np.random.uniform(50, 150, num_particles)
+        self.particle_vx[start:end] = cos_angles * speeds
+        self.particle_vy[start:end] = sin_angles * speeds
+        self.particle_size[start:end] = np.random.uniform(2, PARTICLE_MAX_SIZE, num_particles)
+        lifetimes = np.random.uniform(0.5, 1.5, num_particles)
+        self.particle_lifetime[start:end] = lifetimes
+        self.particle_max_lifetime[start:end] = lifetimes
+        
+        # Random color (bright colors)
+        self.particle_color[start:end] = np.random.randint(0, len(PARTICLE_COLORS), num_particles)
+        
+        self.particle_count = end
     
     def update_particles(self, dt):
         """Update particle effects."""
-        # Update and remove expired particles
-        for i in range(len(self.particles) - 1, -1, -1):
-            particle = self.particles[i]
+        n = self.particle_count
+        if n == 0:
+            return
+            
+        # Update position and lifetime of every live particle at once
+        self.particle_x[:n] += self.particle_vx[:n] * dt
+        self.particle_y[:n] += self.particle_vy[:n] * dt
+        self.particle_lifetime[:n] -= dt
+        
+        # Remove expired particles by compacting the live ones to the front
+        alive = self.particle_lifetime[:n] > 0
+        if not alive.all():
+            keep = np.flatnonzero(alive)
+            for array in self.get_particle_arrays():
+                array[:len(keep)] = array[keep]
+            self.particle_count = len(keep)
+    
+    def get_step_text(self, step_index, panel_y, panel_height):
+        """
+        Get the rendered panel text for a step, rendering it on first use.
+        
+        Args:
+            step_index: Index of the tutorial step
+            panel_y: Top of the info panel
+            panel_height: Height of the info panel
+            
+        Returns:
+            list: (surface, rect) pairs ready to blit
+        """
+        text = self.text_cache.get(step_index)
+        if text is None:
+            step = self.steps[step_index]
+            lines = [
+                (step['title'], 30, panel_y + 30, YELLOW),
+                (step['message'], 20, panel_y + 80, WHITE)
+            ]
             
-            # Update position
-            particle['x'] += particle['vx'] * dt
-            particle['y'] += particle['vy'] * dt
+            # "Press space" indicator if not auto-advancing
+            if not step['auto_advance']:
+                lines.append(("Press SPACE to continue...", 16, panel_y + panel_height - 25, LIGHT_GRAY))
             
-            # Update lifetime
-            particle['lifetime'] -= dt
+            text = []
+            for string, size, y, color in lines:
+                text_surface = convert_surface(get_font(size).render(string, True, color))
+                text_rect = text_surface.get_rect(center=(SCREEN_WIDTH // 2, y))
+                text.append((text_surface, text_rect))
+            self.text_cache[step_index] = text
             
-            # Remove expired particles
-            if particle['lifetime'] <= 0:
-                self.particles.pop(i)
+        return text
     
     def find_highlight_target(self, target_type):
         """
@@ -346,14 +482,15 @@ class Tutorial:
         
         elif target_type == 'platform':
             # Find the closest platform above the player
-            player = self.game.player1
+            player_y = self.game.player1.y
             closest_platform = None
             min_distance = float('inf')
             
             for platform in self.game.platforms:
-                platform_rect = platform.get_rect()
-                if platform_rect.bottom < player.y:  # Platform is above player
-                    distance = player.y - platform_rect.bottom
+                # Platform position is its center
+                platform_bottom = platform.y + platform.height / 2
+                if platform_bottom < player_y:  # Platform is above player
+                    distance = player_y - platform_bottom
                     if distance < min_distance:
                         min_distance = distance
                         closest_platform = platform
@@ -384,34 +521,53 @@ class Tutorial:
         
         return None
     
-    def find_arrow_position(self, target_type, offset):
+    def get_highlight_target(self, target_type):
         """
-        Calculate the position for a pointing arrow.
+        Get the rectangle to highlight, reusing the last search where possible.
+        
+        Platforms never move, so platform lookups are cached for the whole step.
+        The platform closest above the player is only searched again every
+        HIGHLIGHT_REFRESH_TIME seconds or once the player moves vertically by
+        more than HIGHLIGHT_REFRESH_DISTANCE.
         
         Args:
-            target_type: Type of object to point at
-            offset: Distance offset from the target
+            target_type: Type of object to highlight
             
         Returns:
-            tuple or None: (x, y, angle) for the arrow
+            pygame.Rect or None: Rectangle to highlight
         """
-        if not target_type:
-            return None
+        # Players and powerups move, and finding them is cheap
+        if target_type not in ('platform', 'jump_platform', 'passthrough_platform', 'score'):
+            return self.find_highlight_target(target_type)
+        
+        cached = self.highlight_cache.get(target_type)
+        if target_type == 'platform':
+            player_y = self.game.player1.y
+            if (cached and self.timer - cached[1] < HIGHLIGHT_REFRESH_TIME
+                    and abs(player_y - cached[2]) <= HIGHLIGHT_REFRESH_DISTANCE):
+                return cached[0]
+            target_rect = self.find_highlight_target(target_type)
+            self.highlight_cache[target_type] = (target_rect, self.timer, player_y)
+            return target_rect
+        
+        if cached is None:
+            cached = (self.find_highlight_target(target_type),)
+            self.highlight_cache[target_type] = cached
+        return cached[0]
+    
+    def find_arrow_position(self):
+        """
+        Calculate the position for the current step's pointing arrow.
         
-        target_rect = self.find_highlight_target(target_type)
+        Returns:
+            tuple or None: (x, y) for the arrow
+        """
+        target_rect = self.get_highlight_target(self.arrow_target_type)
         if not target_rect:
             return None
         
-        # Calculate center of target
-        target_x = target_rect.centerx
-        target_y = target_rect.centery
-        
-        # Position arrow above target
-        arrow_x = target_x
-        arrow_y = target_y - offset - self.arrow_bounce  # Add bounce animation
-        angle = 90  # Pointing downward
-        
-        return (arrow_x, arrow_y, angle)
+        # Position arrow above the center of the target, with bounce animation
+        return (target_rect.centerx, target_rect.centery - self.arrow_offset - self.arrow_bounce)
     
     def draw(self, screen, camera=None):
         """
@@ -424,18 +580,13 @@ class Tutorial:
         if not self.active:
             return
         
-        # Get current step
-        current_step = self.steps[self.current_step]
-        
         # Draw semi-transparent overlay
-        overlay = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT), pygame.SRCALPHA)
-        overlay.fill((0, 0, 0, 120))  # Semi-transparent dark overlay
-        screen.blit(overlay, (0, 0))
+        screen.blit(self.overlay, (0, 0))
         
         # Draw highlighted area if specified
-        highlight_target = current_step.get('highlight')
+        highlight_target = self.step_highlight
         if highlight_target:
-            target_rect = self.find_highlight_target(highlight_target)
+            target_rect = self.get_highlight_target(highlight_target)
             if target_rect and camera:
                 # Transform rect with camera
                 target_rect = camera.apply(target_rect)
@@ -444,26 +595,14 @@ class Tutorial:
                 pygame.draw.rect(screen, (255, 255, 100, 180), target_rect.inflate(20, 20), 3, border_radius=5)
         
         # Draw instruction arrow
-        arrow_target = current_step.get('arrow')
-        if arrow_target:
-            target_type, offset = arrow_target
-            arrow_pos = self.find_arrow_position(target_type, offset)
+        if self.arrow_target_type:
+            arrow_pos = self.find_arrow_position()
             
             if arrow_pos and camera:
-                arrow_x, arrow_y, angle = arrow_pos
-                transformed_pos = camera.apply_pos((arrow_x, arrow_y))
+                transformed_pos = camera.apply_pos(arrow_pos)
                 
                 # Draw a bouncing arrow
-                arrow_size = 20
-                arrow_color = (255, 255, 100)
-                
-                # Draw triangle arrow
-                arrow_points = [
-                    (transformed_pos[0], transformed_pos[1] + arrow_size),
-                    (transformed_pos[0] - arrow_size/2, transformed_pos[1]),
-                    (transformed_pos[0] + arrow_size/2, transformed_pos[1])
-                ]
-                pygame.draw.polygon(screen, arrow_color, arrow_points)
+                screen.blit(self.arrow_surface, (transformed_pos[0] - self.arrow_size // 2, transformed_pos[1]))
         
         # Draw info panel
         panel_width = 600
@@ -476,30 +615,23 @@ class Tutorial:
         pygame.draw.rect(screen, (40, 40, 60, 220), panel_rect, border_radius=10)
         pygame.draw.rect(screen, (100, 100, 200), panel_rect, 3, border_radius=10)
         
-        # Draw title
-        title_y = panel_y + 30
-        draw_text(screen, current_step['title'], 30, SCREEN_WIDTH // 2, title_y, YELLOW)
-        
-        # Draw message
-        message_y = panel_y + 80
-        draw_text(screen, current_step['message'], 20, SCREEN_WIDTH // 2, message_y, WHITE)
-        
-        # Draw "press space" indicator if not auto-advancing
-        if not current_step['auto_advance']:
-            prompt_y = panel_y + panel_height - 25
-            draw_text(screen, "Press SPACE to continue...", 16, SCREEN_WIDTH // 2, prompt_y, LIGHT_GRAY)
+        # Draw title, message and "press space" indicator
+        for text_surface, text_rect in self.get_step_text(self.current_step, panel_y, panel_height):
+            screen.blit(text_surface, text_rect)
         
         # Draw particles
-        for particle in self.particles:
-            # Calculate particle opacity based on remaining lifetime
-            alpha = int(255 * (particle['lifetime'] / particle['max_lifetime']))
-            size = particle['size']
-            color = particle['color']
+        n = self.particle_count
+        if n:
+            size = self.particle_size[:n]
+            xs = (self.particle_x[:n] - size).astype(np.int32).tolist()
+            ys = (self.particle_y[:n] - size).astype(np.int32).tolist()
+            sizes = size.astype(np.int32).tolist()
+            colors = self.particle_color[:n].tolist()
             
-            # Create surface for particle
-            particle_surf = pygame.Surface((int(size * 2), int(size * 2)), pygame.SRCALPHA)
-            particle_color_with_alpha = (*color, alpha)
-            pygame.draw.circle(particle_surf, particle_color_with_alpha, (int(size), int(size)), int(size))
+            # Calculate particle opacity based on remaining lifetime
+            alphas = (255 * self.particle_lifetime[:n] / self.particle_max_lifetime[:n]).astype(np.int32).tolist()
             
-            # Blit particle to screen
-            screen.blit(particle_surf, (int(particle['x'] - size), int(particle['y'] - size)))
\ No newline at end of file
+            for px, py, size_bin, color_index, alpha in zip(xs, ys, sizes, colors, alphas):
+                particle_surf = self.particle_sprites[color_index][size_bin]
+                particle_surf.set_alpha(alpha)
+                screen.blit(particle_surf, (px, py))
@@ -5,7 +5,14 @@ Defines the UI class for handling game interface elements.
 
 import pygame
 from constants import *
-import time
+from utils import convert_surface, get_font
+
+# Timer fill color by time left: the first entry whose threshold the time is
+# under wins, otherwise the timer is green
+TIMER_FILL_COLORS = ((10, RED), (20, YELLOW))
+
+# Timer text for every whole second of a round
+TIMER_STRINGS = [f"{seconds // 60:01d}:{seconds % 60:02d}" for seconds in range(int(ROUND_TIME) + 1)]
 
 class UI:
     def __init__(self, game):
@@ -19,16 +26,26 @@ class UI:
         
         # Load fonts
         pygame.font.init()
-        self.font_large = pygame.font.Font(None, 64)
-        self.font_medium = pygame.font.Font(None, 48)
-        self.font_small = pygame.font.Font(None, 32)
-        self.font_tiny = pygame.font.Font(None, 24)
+        self.font_large = get_font(64)
+        self.font_medium = get_font(48)
+        self.font_small = get_font(32)
+        self.font_tiny = get_font(24)
         
         # UI state
         self.round_end_message = ""
         self.game_end_message = ""
         self.show_message_until = 0
         
+        # Rendered message text, updated when a message is set
+        self.round_end_text = None
+        self.game_end_text = None
+        
+        # Screen areas drawn by the last call to draw()
+        self.dirty_rects = []
+        
+        # Caps the title screen loop when events arrive quickly
+        self.clock = pygame.time.Clock()
+        
         # UI elements
         self.create_ui_elements()
         
@@ -42,6 +59,167 @@ class UI:
             button_width, button_height
         )
         
+        # Title screen header
+        self.title_header = pygame.Rect(0, 50, SCREEN_WIDTH, 150)
+        
+        # Player stats background boxes
+        self.p1_box = pygame.Rect(10, 10, 250, 80)
+        self.p2_box = pygame.Rect(SCREEN_WIDTH - 260, 10, 250, 80)
+        
+        # Round timer background, and the fill whose width shows the time left
+        timer_width, timer_height = 200, 30
+        self.timer_bg = pygame.Rect(SCREEN_WIDTH // 2 - timer_width // 2, 40, timer_width, timer_height)
+        self.timer_fill = self.timer_bg.copy()
+        
+        # Title screen text
+        self.title_text = convert_surface(self.font_large.render("TAG ARENA", True, (255, 255, 255)))
+        self.title_rect = self.title_text.get_rect(center=(SCREEN_WIDTH // 2, 125))
+        
+        desc_lines = [
+            "A two-player tag game with custom physics and power-ups!",
+            "",
+            "Player 1 Controls: WASD",
+            "Player 2 Controls: Arrow Keys",
+            "",
+            "Platform Types:",
+            "- Gray: Normal platforms",
+            "- Orange: Sticky platforms (slow movement)",
+            "- Green: Jump platforms (higher jumps)",
+            "- Blue: Speed platforms (faster movement)",
+            "- Purple: Pass-through platforms (press DOWN to drop through)",
+            "",
+            "Power-ups:",
+            "- Yellow: Speed Boost",
+            "- Blue: Shield (temporary tag immunity)",
+            "- Light Blue: Freeze (freeze opponent)",
+            "- Green: Super Jump",
+            "- Purple: Invisibility"
+        ]
+        
+        self.desc_texts = []
+        y_pos = 220
+        for line in desc_lines:
+            text = convert_surface(self.font_tiny.render(line, True, (255, 255, 255)))
+            self.desc_texts.append((text, text.get_rect(center=(SCREEN_WIDTH // 2, y_pos))))
+            y_pos += 25
+            
+        self.start_text = convert_surface(self.font_medium.render("START GAME", True, (255, 255, 255)))
+        self.start_text_rect = self.start_text.get_rect(center=self.start_button_rect.center)
+        
+        self.space_text = convert_surface(self.font_small.render("or press SPACE to start", True, (200, 200, 200)))
+        self.space_rect = self.space_text.get_rect(center=(SCREEN_WIDTH // 2, self.start_button_rect.bottom + 40))
+        
+        # Player status labels, keyed by whether the player is the tagger
+        self.status_texts = {
+            True: convert_surface(self.font_small.render("TAGGER", True, TAGGER_COLOR)),
+            False: convert_surface(self.font_small.render("RUNNER", True, BLUE))
+        }
+        
+        # Pause screen overlay and text
+        self.pause_overlay = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT), pygame.SRCALPHA)
+        self.pause_overlay.fill((0, 0, 0, 128))
+        self.pause_overlay = convert_surface(self.pause_overlay)
+        
+        pause_text = convert_surface(self.font_large.render("PAUSED", True, WHITE))
+        instructions = convert_surface(self.font_small.render("Press ESC to resume", True, WHITE))
+        restart_text = convert_surface(self.font_small.render("Press R to restart round", True, WHITE))
+        self.pause_texts = [
+            (pause_text, pause_text.get_rect(center=(SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2 - 50))),
+            (instructions, instructions.get_rect(center=(SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2 + 20))),
+            (restart_text, restart_text.get_rect(center=(SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2 + 60)))
+        ]
+        
+        # Translucent background boxes keyed by size, colors and border width
+        self.box_cache = {}
+        
+        # Round start and end-of-round/game prompts
+        self.round_start_text = convert_surface(self.font_medium.render("Press SPACE to start the game!", True, WHITE))
+        self.round_start_rect = self.round_start_text.get_rect(center=(SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2))
+        
+        self.continue_text = convert_surface(self.font_small.render("Press SPACE to continue", True, WHITE))
+        self.continue_rect = self.continue_text.get_rect(center=(SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2 + 20))
+        
+        self.restart_text = convert_surface(self.font_small.render("Press R to restart", True, WHITE))
+        self.restart_rect = self.restart_text.get_rect(center=(SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2 + 120))
+        
+        # Score labels keyed by where they are shown, each stored with the
+        # score and color it was rendered for
+        self.score_text_cache = {}
+        
+        # Power-up icons for each type, in active and inactive colors
+        self.powerup_icon_size = 24
+        self.powerup_icons_active = {
+            powerup_type: self.create_powerup_icon(powerup_type, POWERUP_COLORS[powerup_type])
+            for powerup_type in POWERUP_TYPES
+        }
+        self.powerup_icons_inactive = {
+            powerup_type: self.create_powerup_icon(powerup_type, (70, 70, 70))
+            for powerup_type in POWERUP_TYPES
+        }
+        
+        # Icon x offset and surfaces for each slot of the power-up strip,
+        # in POWERUP_TYPES order, plus the strip's background size
+        self.powerup_icon_spacing = 30
+        self.powerup_render_data = [
+            (i * self.powerup_icon_spacing,
+             self.powerup_icons_active[powerup_type],
+             self.powerup_icons_inactive[powerup_type])
+            for i, powerup_type in enumerate(POWERUP_TYPES)
+        ]
+        self.powerup_strip_size = (len(POWERUP_TYPES) * self.powerup_icon_spacing, self.powerup_icon_size + 10)
+        
+        # Round number and timer text (plus the timer fill color), updated
+        # only when the round number or whole seconds left change
+        self.round_text_cache = (None, None)
+        self.timer_text_cache = (None, None, None)
+        
+    def create_powerup_icon(self, powerup_type, fill_color):
+        """
+        Draw a power-up indicator icon onto its own surface.
+        
+        Args:
+            powerup_type: type of power-up the icon shows
+            fill_color: background color of the icon
+            
+        Returns:
+            pygame.Surface: icon with a 2 pixel margin around the circle
+        """
+        icon_size = self.powerup_icon_size
+        icon = pygame.Surface((icon_size + 4, icon_size + 4), pygame.SRCALPHA)
+        
+        # Icon center, and the top of the icon circle
+        icon_x = icon_size // 2 + 2
+        y = 2
+        
+        # Draw icon background
+        pygame.draw.circle(icon, fill_color, (icon_x, y + icon_size//2), icon_size//2)
+        
+        # Draw icon outline
+        pygame.draw.circle(icon, WHITE, (icon_x, y + icon_size//2), icon_size//2, 1)
+        
+        # Draw icon symbol based on powerup type
+        if powerup_type == "speed":
+            # Lightning bolt
+            pygame.draw.line(icon, BLACK, (icon_x - 3, y + 5), (icon_x + 3, y + icon_size - 5), 2)
+        elif powerup_type == "shield":
+            # Shield outline
+            pygame.draw.circle(icon, BLACK, (icon_x, y + icon_size//2), icon_size//3, 2)
+        elif powerup_type == "freeze":
+            # Snowflake
+            pygame.draw.line(icon, BLACK, (icon_x, y + 5), (icon_x, y + icon_size - 5), 2)
+            pygame.draw.line(icon, BLACK, (icon_x - 6, y + icon_size//2), (icon_x + 6, y + icon_size//2), 2)
+        elif powerup_type == "super_jump":
+            # Up arrow
+            points = [(icon_x, y + 5), (icon_x - 5, y + 15), (icon_x + 5, y + 15)]
+            pygame.draw.polygon(icon, BLACK, points, 2)
+        elif powerup_type == "invisible":
+            # Eye with line through it
+            pygame.draw.circle(icon, BLACK, (icon_x, y + icon_size//2), icon_size//4, 1)
+            pygame.draw.line(icon, BLACK, (icon_x - 6, y + icon_size//2 - 6), 
+                            (icon_x + 6, y + icon_size//2 + 6), 2)
+                            
+        return convert_surface(icon)
+        
     def show_title_screen(self, screen):
         """
         Display the title screen until player starts the game.
@@ -50,13 +228,48 @@ class UI:
             screen: screen surface to draw on
         """
         waiting_for_start = True
+        redraw = True
+        
+        # Keep events the title screen ignores out of the queue entirely
+        ignored_events = [pygame.MOUSEMOTION, pygame.ACTIVEEVENT, pygame.AUDIODEVICEADDED]
+        pygame.event.set_blocked(ignored_events)
         
         # Background colors
         bg_color = (30, 30, 50)
         header_color = (50, 50, 80)
         
         while waiting_for_start:
-            for event in pygame.event.get():
+            # The title screen is static, so only draw it when it needs refreshing
+            if redraw:
+                # Fill background
+                screen.fill(bg_color)
+                
+                # Draw title header
+                pygame.draw.rect(screen, header_color, self.title_header)
+                
+                # Draw title
+                screen.blit(self.title_text, self.title_rect)
+                
+                # Draw game description
+                screen.blits(self.desc_texts, False)
+                
+                # Draw start button
+                pygame.draw.rect(screen, (80, 180, 80), self.start_button_rect)
+                pygame.draw.rect(screen, (50, 150, 50), self.start_button_rect, 3)
+                
+                screen.blit(self.start_text, self.start_text_rect)
+                
+                # Draw press space message
+                screen.blit(self.space_text, self.space_rect)
+                
+                pygame.display.flip()
+                redraw = False
+                
+            # Sleep until input arrives, then handle everything that is queued
+            events = [pygame.event.wait(100)]
+            events += pygame.event.get((pygame.QUIT, pygame.KEYDOWN, pygame.MOUSEBUTTONDOWN, pygame.VIDEOEXPOSE))
+            pygame.event.clear()
+            for event in events:
                 if event.type == pygame.QUIT:
                     pygame.quit()
                     exit()
@@ -68,81 +281,82 @@ class UI:
                     if self.start_button_rect.collidepoint(event.pos):
                         waiting_for_start = False
                         
-            # Fill background
-            screen.fill(bg_color)
-            
-            # Draw title header
-            pygame.draw.rect(screen, header_color, (0, 50, SCREEN_WIDTH, 150))
-            
-            # Draw title
-            title_text = self.font_large.render("TAG ARENA", True, (255, 255, 255))
-            title_rect = title_text.get_rect(center=(SCREEN_WIDTH // 2, 125))
-            screen.blit(title_text, title_rect)
-            
-            # Draw game description
-            desc_lines = [
-                "A two-player tag game with custom physics and power-ups!",
-                "",
-                "Player 1 Controls: WASD",
-                "Player 2 Controls: Arrow Keys",
-                "",
-                "Platform Types:",
-                "- Gray: Normal platforms",
-                "- Orange: Sticky platforms (slow movement)",
-                "- Green: Jump platforms (higher jumps)",
-                "- Blue: Speed platforms (faster movement)",
-                "- Purple: Pass-through platforms (press DOWN to drop through)",
-                "",
-                "Power-ups:",
-                "- Yellow: Speed Boost",
-                "- Blue: Shield (temporary tag immunity)",
-                "- Light Blue: Freeze (freeze opponent)",
-                "- Green: Super Jump",
-                "- Purple: Invisibility"
-            ]
-            
-            y_pos = 220
-            for line in desc_lines:
-                text = self.font_tiny.render(line, True, (255, 255, 255))
-                text_rect = text.get_rect(center=(SCREEN_WIDTH // 2, y_pos))
-                screen.blit(text, text_rect)
-                y_pos += 25
-                
-            # Draw start button
-            pygame.draw.rect(screen, (80, 180, 80), self.start_button_rect)
-            pygame.draw.rect(screen, (50, 150, 50), self.start_button_rect, 3)
-            
-            start_text = self.font_medium.render("START GAME", True, (255, 255, 255))
-            start_text_rect = start_text.get_rect(center=self.start_button_rect.center)
-            screen.blit(start_text, start_text_rect)
-            
-            # Draw press space message
-            space_text = self.font_small.render("or press SPACE to start", True, (200, 200, 200))
-            space_rect = space_text.get_rect(center=(SCREEN_WIDTH // 2, self.start_button_rect.bottom + 40))
-            screen.blit(space_text, space_rect)
+                if event.type == pygame.VIDEOEXPOSE:
+                    # Window contents were lost, e.g. after being uncovered
+                    redraw = True
+                    
+            self.clock.tick(60)
             
-            pygame.display.flip()
-            pygame.time.wait(10)
+        pygame.event.set_allowed(ignored_events)
             
-    def set_round_end_message(self, message):
+    def set_round_end_message(self, message, now):
         """
         Set a message to display at the end of a round.
         
         Args:
             message: string message to display
+            now: current time from time.monotonic()
         """
         self.round_end_message = message
-        self.show_message_until = time.time() + 3.0  # Show for 3 seconds
+        self.round_end_text = convert_surface(self.font_medium.render(message, True, WHITE)) if message else None
+        self.show_message_until = now + 3.0  # Show for 3 seconds
         
-    def set_game_end_message(self, message):
+    def set_game_end_message(self, message, now):
         """
         Set a message to display at the end of the game.
         
         Args:
             message: string message to display
+            now: current time from time.monotonic()
         """
         self.game_end_message = message
-        self.show_message_until = time.time() + 5.0  # Show for 5 seconds
+        self.game_end_text = convert_surface(self.font_large.render(message, True, WHITE)) if message else None
+        self.show_message_until = now + 5.0  # Show for 5 seconds
+        
+    def get_box_surface(self, size, fill_color, border_color, border_width):
+        """
+        Get a translucent box with a solid border, drawing it on first use.
+        
+        Args:
+            size: (width, height) of the box
+            fill_color: RGBA fill color
+            border_color: RGB border color
+            border_width: border width in pixels
+            
+        Returns:
+            pygame.Surface: the box, with per-pixel alpha
+        """
+        key = (tuple(size), tuple(fill_color), tuple(border_color), border_width)
+        box = self.box_cache.get(key)
+        if box is None:
+            box = pygame.Surface(size, pygame.SRCALPHA)
+            box.fill(fill_color)
+            if border_width:
+                pygame.draw.rect(box, border_color, box.get_rect(), border_width)
+            box = convert_surface(box)
+            self.box_cache[key] = box
+        return box
+        
+    def get_score_text(self, cache_key, player_number, score, font, color):
+        """
+        Get a rendered "Player N: score" label, rendering it only when the score or color changes.
+        
+        Args:
+            cache_key: key identifying where the label is shown
+            player_number: 1 or 2
+            score: the player's score
+            font: font to render with
+            color: text color
+            
+        Returns:
+            pygame.Surface: the rendered label
+        """
+        cached = self.score_text_cache.get(cache_key)
+        if cached is None or cached[0] != (score, color):
+            text = convert_surface(font.render(f"Player {player_number}: {score}", True, color))
+            cached = ((score, color), text)
+            self.score_text_cache[cache_key] = cached
+        return cached[1]
         
     def draw_player_stats(self, screen):
         """
@@ -155,40 +369,33 @@ class UI:
         player1 = self.game.player1
         
         # Background box
-        p1_box = pygame.Rect(10, 10, 250, 80)
-        pygame.draw.rect(screen, (20, 20, 30, 200), p1_box)
-        pygame.draw.rect(screen, player1.color, p1_box, 3)
+        screen.blit(self.get_box_surface(self.p1_box.size, (20, 20, 30, 200), player1.color, 3), self.p1_box)
         
         # Name and score
-        p1_name = self.font_small.render(f"Player 1: {player1.score}", True, WHITE)
+        p1_name = self.get_score_text('stats_p1', 1, player1.score, self.font_small, WHITE)
         screen.blit(p1_name, (20, 15))
         
         # Status (tagger or runner)
-        status_text = "TAGGER" if player1.is_tagger else "RUNNER"
-        status_color = TAGGER_COLOR if player1.is_tagger else BLUE
-        p1_status = self.font_small.render(status_text, True, status_color)
-        screen.blit(p1_status, (20, 45))
+        screen.blit(self.status_texts[bool(player1.is_tagger)], (20, 45))
         
         # Player 2 stats - right side
         player2 = self.game.player2
         
         # Background box
-        p2_box = pygame.Rect(SCREEN_WIDTH - 260, 10, 250, 80)
-        pygame.draw.rect(screen, (20, 20, 30, 200), p2_box)
-        pygame.draw.rect(screen, player2.color, p2_box, 3)
+        screen.blit(self.get_box_surface(self.p2_box.size, (20, 20, 30, 200), player2.color, 3), self.p2_box)
         
         # Name and score
-        p2_name = self.font_small.render(f"Player 2: {player2.score}", True, WHITE)
+        p2_name = self.get_score_text('stats_p2', 2, player2.score, self.font_small, WHITE)
         p2_name_rect = p2_name.get_rect(topright=(SCREEN_WIDTH - 20, 15))
         screen.blit(p2_name, p2_name_rect)
         
         # Status (tagger or runner)
-        status_text = "TAGGER" if player2.is_tagger else "RUNNER"
-        status_color = TAGGER_COLOR if player2.is_tagger else BLUE
-        p2_status = self.font_small.render(status_text, True, status_color)
+        p2_status = self.status_texts[bool(player2.is_tagger)]
         p2_status_rect = p2_status.get_rect(topright=(SCREEN_WIDTH - 20, 45))
         screen.blit(p2_status, p2_status_rect)
         
+        self.dirty_rects += [self.p1_box, self.p2_box]
+        
         # Draw active power-ups for each player
         self.draw_active_powerups(screen, player1, 20, 90)
         self.draw_active_powerups(screen, player2, SCREEN_WIDTH - 170, 90)
@@ -202,55 +409,34 @@ class UI:
             player: player object
             x, y: position to start drawing indicators
         """
-        icon_size = 24
-        spacing = 30
+        icon_size = self.powerup_icon_size
         
         # Create a semi-transparent background for the power-up icons
-        icon_bg_width = len(POWERUP_TYPES) * spacing
-        icon_bg = pygame.Rect(x - 5, y - 5, icon_bg_width, icon_size + 10)
-        pygame.draw.rect(screen, (0, 0, 0, 128), icon_bg)
-        
-        # Draw powerup icons
-        for i, powerup_type in enumerate(POWERUP_TYPES):
-            icon_x = x + i * spacing
-            icon_color = POWERUP_COLORS[powerup_type]
-            
-            # Draw icon background (gray if inactive, colored if active)
-            if powerup_type in player.active_powerups:
-                pygame.draw.circle(screen, icon_color, (icon_x, y + icon_size//2), icon_size//2)
-                
-                # Draw remaining time indicator
-                remaining = player.active_powerups[powerup_type] / POWERUP_DURATION
-                pygame.draw.rect(screen, WHITE, 
-                                (icon_x - icon_size//2, y + icon_size + 2, 
-                                icon_size * remaining, 3))
+        icon_bg = self.get_box_surface(self.powerup_strip_size, (0, 0, 0, 128), BLACK, 0)
+        self.dirty_rects.append(screen.blit(icon_bg, (x - 5, y - 5)))
+        
+        # Collect powerup icons (colored if active, gray if inactive) to
+        # blit in one call, along with the remaining time of active ones
+        icon_blits = []
+        time_bars = []
+        icon_y = y - 2
+        for (offset, icon_active, icon_inactive), time_left in zip(
+                self.powerup_render_data, player.active_powerups.tolist()):
+            icon_x = x + offset
+            if time_left > 0:
+                icon_blits.append((icon_active, (icon_x - icon_size//2 - 2, icon_y)))
+                time_bars.append((icon_x, time_left))
             else:
-                # Draw inactive icon
-                pygame.draw.circle(screen, (70, 70, 70), (icon_x, y + icon_size//2), icon_size//2)
+                icon_blits.append((icon_inactive, (icon_x - icon_size//2 - 2, icon_y)))
                 
-            # Draw icon outline
-            pygame.draw.circle(screen, WHITE, (icon_x, y + icon_size//2), icon_size//2, 1)
-            
-            # Draw icon symbol based on powerup type
-            if powerup_type == "speed":
-                # Lightning bolt
-                pygame.draw.line(screen, BLACK, (icon_x - 3, y + 5), (icon_x + 3, y + icon_size - 5), 2)
-            elif powerup_type == "shield":
-                # Shield outline
-                pygame.draw.circle(screen, BLACK, (icon_x, y + icon_size//2), icon_size//3, 2)
-            elif powerup_type == "freeze":
-                # Snowflake
-                pygame.draw.line(screen, BLACK, (icon_x, y + 5), (icon_x, y + icon_size - 5), 2)
-                pygame.draw.line(screen, BLACK, (icon_x - 6, y + icon_size//2), (icon_x + 6, y + icon_size//2), 2)
-            elif powerup_type == "super_jump":
-                # Up arrow
-                points = [(icon_x, y + 5), (icon_x - 5, y + 15), (icon_x + 5, y + 15)]
-                pygame.draw.polygon(screen, BLACK, points, 2)
-            elif powerup_type == "invisible":
-                # Eye with line through it
-                pygame.draw.circle(screen, BLACK, (icon_x, y + icon_size//2), icon_size//4, 1)
-                pygame.draw.line(screen, BLACK, (icon_x - 6, y + icon_size//2 - 6), 
-                                (icon_x + 6, y + icon_size//2 + 6), 2)
+        screen.blits(icon_blits, False)
+        
+        # Draw remaining time indicators below the icons
+        for icon_x, time_left in time_bars:
+            remaining = time_left / POWERUP_DURATION
+            pygame.draw.rect(screen, WHITE, 
+                            (icon_x - icon_size//2, y + icon_size + 2, 
+                            icon_size * remaining, 3))
         
     def draw_round_timer(self, screen):
         """
@@ -260,48 +446,48 @@ class UI:
             screen: screen surface to draw on
         """
         # Draw round number
-        round_text = self.font_small.render(f"Round {self.game.round_number}", True, WHITE)
+        round_number, round_text = self.round_text_cache
+        if round_number != self.game.round_number:
+            round_number = self.game.round_number
+            round_text = convert_surface(self.font_small.render(f"Round {round_number}", True, WHITE))
+            self.round_text_cache = (round_number, round_text)
         round_rect = round_text.get_rect(center=(SCREEN_WIDTH // 2, 20))
         screen.blit(round_text, round_rect)
-        
+        self.dirty_rects += [round_rect, self.timer_bg]
+        
+        # Timer text and fill color only change once per second
+        time_left = int(self.game.round_time_left)
+        cached_time, timer_text, fill_color = self.timer_text_cache
+        if cached_time != time_left:
+            if 0 <= time_left < len(TIMER_STRINGS):
+                timer_string = TIMER_STRINGS[time_left]
+            else:
+                timer_string = f"{time_left // 60:01d}:{time_left % 60:02d}"
+            timer_text = convert_surface(self.font_small.render(timer_string, True, WHITE))
+            
+            # Change color based on time left
+            fill_color = GREEN
+            for threshold, color in TIMER_FILL_COLORS:
+                if time_left < threshold:
+                    fill_color = color
+                    break
+                    
+            self.timer_text_cache = (time_left, timer_text, fill_color)
+            
         # Draw timer background
-        timer_width = 200
-        timer_height = 30
-        timer_bg = pygame.Rect(
-            SCREEN_WIDTH // 2 - timer_width // 2, 
-            40, 
-            timer_width, 
-            timer_height
-        )
+        timer_bg = self.timer_bg
         pygame.draw.rect(screen, (40, 40, 40), timer_bg)
         
         # Draw timer fill
         if self.game.round_time_left > 0 and self.game.round_in_progress:
-            fill_width = (self.game.round_time_left / ROUND_TIME) * timer_width
-            timer_fill = pygame.Rect(
-                SCREEN_WIDTH // 2 - timer_width // 2, 
-                40, 
-                fill_width, 
-                timer_height
-            )
-            
-            # Change color based on time left
-            if self.game.round_time_left < 10:
-                fill_color = RED
-            elif self.game.round_time_left < 20:
-                fill_color = YELLOW
-            else:
-                fill_color = GREEN
-                
+            timer_fill = self.timer_fill
+            timer_fill.width = int(self.game.round_time_left / ROUND_TIME * timer_bg.width)
             pygame.draw.rect(screen, fill_color, timer_fill)
             
         # Draw timer border
         pygame.draw.rect(screen, WHITE, timer_bg, 2)
         
         # Draw timer text
-        minutes = int(self.game.round_time_left) // 60
-        seconds = int(self.game.round_time_left) % 60
-        timer_text = self.font_small.render(f"{minutes:01d}:{seconds:02d}", True, WHITE)
         timer_text_rect = timer_text.get_rect(center=timer_bg.center)
         screen.blit(timer_text, timer_text_rect)
         
@@ -314,70 +500,68 @@ class UI:
         """
         if not self.game.round_in_progress and self.game.round_number == 0:
             # First round hasn't started yet
-            message = "Press SPACE to start the game!"
-            text = self.font_medium.render(message, True, WHITE)
-            text_rect = text.get_rect(center=(SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2))
+            text = self.round_start_text
+            text_rect = self.round_start_rect
             
             # Draw background
             bg_rect = text_rect.inflate(40, 20)
-            pygame.draw.rect(screen, (0, 0, 0, 180), bg_rect)
-            pygame.draw.rect(screen, WHITE, bg_rect, 2)
+            screen.blit(self.get_box_surface(bg_rect.size, (0, 0, 0, 180), WHITE, 2), bg_rect)
+            self.dirty_rects.append(bg_rect)
             
             screen.blit(text, text_rect)
             
-    def draw_game_messages(self, screen):
+    def draw_game_messages(self, screen, now):
         """
         Draw round end and game end messages.
         
         Args:
             screen: screen surface to draw on
+            now: current time from time.monotonic()
         """
-        current_time = time.time()
-        
+        # Nothing to draw most of the time
+        if now >= self.show_message_until:
+            return
+            
         # Show round end message if active
-        if self.round_end_message and current_time < self.show_message_until:
-            message_text = self.font_medium.render(self.round_end_message, True, WHITE)
+        if self.round_end_message:
+            message_text = self.round_end_text
             text_rect = message_text.get_rect(center=(SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2 - 40))
             
             # Draw background
             bg_rect = text_rect.inflate(40, 20)
-            pygame.draw.rect(screen, (0, 0, 0, 180), bg_rect)
-            pygame.draw.rect(screen, WHITE, bg_rect, 2)
+            screen.blit(self.get_box_surface(bg_rect.size, (0, 0, 0, 180), WHITE, 2), bg_rect)
+            self.dirty_rects.append(bg_rect)
             
             screen.blit(message_text, text_rect)
             
             # Draw continue prompt
-            prompt_text = self.font_small.render("Press SPACE to continue", True, WHITE)
-            prompt_rect = prompt_text.get_rect(center=(SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2 + 20))
-            screen.blit(prompt_text, prompt_rect)
+            self.dirty_rects.append(screen.blit(self.continue_text, self.continue_rect))
             
         # Show game end message if active
-        if self.game_end_message and current_time < self.show_message_until:
-            message_text = self.font_large.render(self.game_end_message, True, WHITE)
+        if self.game_end_message:
+            message_text = self.game_end_text
             text_rect = message_text.get_rect(center=(SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2 - 60))
             
             # Draw background
             bg_rect = text_rect.inflate(40, 20)
-            pygame.draw.rect(screen, (0, 0, 0, 180), bg_rect)
-            pygame.draw.rect(screen, (255, 215, 0), bg_rect, 3)  # Gold border
+            screen.blit(self.get_box_surface(bg_rect.size, (0, 0, 0, 180), (255, 215, 0), 3), bg_rect)  # Gold border
+            self.dirty_rects.append(bg_rect)
             
             screen.blit(message_text, text_rect)
             
             # Draw final scores
-            p1_score_text = self.font_medium.render(
-                f"Player 1: {self.game.player1.score}", True, self.game.player1.color)
+            p1_score_text = self.get_score_text(
+                'final_p1', 1, self.game.player1.score, self.font_medium, self.game.player1.color)
             p1_rect = p1_score_text.get_rect(center=(SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2))
-            screen.blit(p1_score_text, p1_rect)
+            self.dirty_rects.append(screen.blit(p1_score_text, p1_rect))
             
-            p2_score_text = self.font_medium.render(
-                f"Player 2: {self.game.player2.score}", True, self.game.player2.color)
+            p2_score_text = self.get_score_text(
+                'final_p2', 2, self.game.player2.score, self.font_medium, self.game.player2.color)
             p2_rect = p2_score_text.get_rect(center=(SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2 + 50))
-            screen.blit(p2_score_text, p2_rect)
+            self.dirty_rects.append(screen.blit(p2_score_text, p2_rect))
             
             # Draw restart prompt
-            prompt_text = self.font_small.render("Press R to restart", True, WHITE)
-            prompt_rect = prompt_text.get_rect(center=(SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2 + 120))
-            screen.blit(prompt_text, prompt_rect)
+            self.dirty_rects.append(screen.blit(self.restart_text, self.restart_rect))
             
     def draw_pause_screen(self, screen):
         """
@@ -388,31 +572,25 @@ class UI:
         """
         if self.game.paused:
             # Semi-transparent overlay
-            overlay = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT), pygame.SRCALPHA)
-            overlay.fill((0, 0, 0, 128))
-            screen.blit(overlay, (0, 0))
-            
-            # Pause text
-            pause_text = self.font_large.render("PAUSED", True, WHITE)
-            text_rect = pause_text.get_rect(center=(SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2 - 50))
-            screen.blit(pause_text, text_rect)
+            self.dirty_rects.append(screen.blit(self.pause_overlay, (0, 0)))
             
-            # Instructions
-            instructions = self.font_small.render("Press ESC to resume", True, WHITE)
-            inst_rect = instructions.get_rect(center=(SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2 + 20))
-            screen.blit(instructions, inst_rect)
+            # Pause text and instructions
+            screen.blits(self.pause_texts, False)
             
-            restart_text = self.font_small.render("Press R to restart round", True, WHITE)
-            restart_rect = restart_text.get_rect(center=(SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2 + 60))
-            screen.blit(restart_text, restart_rect)
-            
-    def draw(self, screen):
+    def draw(self, screen, now):
         """
         Draw all UI elements.
         
+        The areas drawn are collected in dirty_rects, so when nothing else on
+        screen changed the caller can pass them to pygame.display.update()
+        instead of flipping the whole display.
+        
         Args:
             screen: screen surface to draw on
+            now: current time from time.monotonic(), taken once per frame
         """
+        self.dirty_rects = []
+        
         # Draw player stats
         self.draw_player_stats(screen)
         
@@ -423,7 +601,7 @@ class UI:
         self.draw_round_start_message(screen)
         
         # Draw game messages (round end, game end)
-        self.draw_game_messages(screen)
+        self.draw_game_messages(screen, now)
         
         # Draw pause screen if paused
         self.draw_pause_screen(screen)
@@ -4,12 +4,55 @@ Utility functions for the Tag Game.
 
 import pygame
 import random
+import math
+import numpy as np
+from collections import OrderedDict
 from constants import *
 
+# Default fonts keyed by size, shared by everything that draws text
+_FONT_CACHE = {}
+
+# Rendered text keyed by (text, size, color), least recently used first
+_TEXT_CACHE = OrderedDict()
+_TEXT_CACHE_SIZE = 512
+
+def convert_surface(surface):
+    """
+    Convert a surface to the display's pixel format so blitting it is fast.
+    
+    Surfaces are returned unchanged if no display mode has been set yet.
+    
+    Args:
+        surface: pygame surface with per-pixel alpha
+        
+    Returns:
+        pygame.Surface: converted surface
+    """
+    if pygame.display.get_surface() is None:
+        return surface
+    return surface.convert_alpha()
+
+def get_font(size):
+    """
+    Get the default font at a given size, loading it only once.
+    
+    Args:
+        size: font size
+        
+    Returns:
+        pygame.font.Font: the shared font
+    """
+    font = _FONT_CACHE.get(size)
+    if font is None:
+        font = _FONT_CACHE[size] = pygame.font.Font(None, size)
+    return font
+
 def draw_text(surface, text, size, x, y, color):
     """
     Draw text on a surface with given parameters.
     
+    Rendered text is cached, so drawing the same string again is just a blit.
+    
     Args:
         surface: pygame surface to draw on
         text: string to display
@@ -17,20 +60,43 @@ def draw_text(surface, text, size, x, y, color):
         x, y: position coordinates
         color: RGB color tuple
     """
-    font = pygame.font.Font(None, size)
-    text_surface = font.render(text, True, color)
+    key = (text, size, tuple(color))
+    text_surface = _TEXT_CACHE.get(key)
+    if text_surface is None:
+        text_surface = convert_surface(get_font(size).render(text, True, color))
+        _TEXT_CACHE[key] = text_surface
+        if len(_TEXT_CACHE) > _TEXT_CACHE_SIZE:
+            _TEXT_CACHE.popitem(last=False)
+    else:
+        _TEXT_CACHE.move_to_end(key)
     text_rect = text_surface.get_rect()
     text_rect.center = (x, y)
     surface.blit(text_surface, text_rect)
     
 def random_color():
-    """Generate a random RGB color."""
+    """Generate a random RGB color with each channel in 50-255."""
+    # One 24-bit draw supplies a byte per channel, scaled into range
+    bits = random.getrandbits(24)
     return (
-        random.randint(50, 255),
-        random.randint(50, 255),
-        random.randint(50, 255)
+        50 + (bits & 0xFF) * 206 // 256,
+        50 + ((bits >> 8) & 0xFF) * 206 // 256,
+        50 + (bits >> 16) * 206 // 256
     )
     
 def distance(point1, point2):
     """Calculate Euclidean distance between two points."""
-    return ((point1[0] - point2[0]) ** 2 + (point1[1] - point2[1]) ** 2) ** 0.5
+    return math.hypot(point1[0] - point2[0], point1[1] - point2[1])
+
+def distances(points, point):
+    """
+    Calculate Euclidean distances from many points to one point at once.
+    
+    Args:
+        points: sequence or (N, 2) array of (x, y) points
+        point: (x, y) point to measure from
+        
+    Returns:
+        numpy.ndarray: N distances
+    """
+    points = np.asarray(points, dtype=float)
+    return np.hypot(points[:, 0] - point[0], points[:, 1] - point[1])